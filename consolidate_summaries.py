@@ -6,15 +6,12 @@ Consolidates individual timeframe analysis JSON files into unified summary files
 per currency pair for comprehensive market environment understanding.
 """
 
-import sys
-from pathlib import Path
+from scripts._bootstrap import ensure_src_on_path
 
-PROJECT_ROOT = Path(__file__).resolve().parent
-SRC_PATH = PROJECT_ROOT / "src"
-if str(SRC_PATH) not in sys.path:
-    sys.path.insert(0, str(SRC_PATH))
-
-from fx_kline.core import summary_consolidator
+ensure_src_on_path()
 
 if __name__ == "__main__":
+    # Imported here so importing this module does not pull in pandas
+    from fx_kline.core import summary_consolidator
+
     raise SystemExit(summary_consolidator.main())
@@ -7,7 +7,6 @@ Or use: streamlit run src/fx_kline/ui/streamlit_app.py
 """
 
 import sys
-import subprocess
 from pathlib import Path
 
 
@@ -19,8 +18,11 @@ def main():
         print(f"Error: Streamlit app not found at {app_path}")
         sys.exit(1)
 
-    # Run streamlit
-    subprocess.run([sys.executable, "-m", "streamlit", "run", str(app_path)])
+    # Run streamlit in this interpreter rather than spawning a second one
+    from streamlit.web import cli as stcli
+
+    sys.argv = ["streamlit", "run", str(app_path)]
+    sys.exit(stcli.main())
 
 
 if __name__ == "__main__":
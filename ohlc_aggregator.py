@@ -6,16 +6,12 @@ Usage example:
     python ohlc_aggregator.py --input-dir ./csv_data --output-dir ./reports
 """
 
-import sys
-from pathlib import Path
-
-PROJECT_ROOT = Path(__file__).resolve().parent
-SRC_PATH = PROJECT_ROOT / "src"
-if str(SRC_PATH) not in sys.path:
-    sys.path.insert(0, str(SRC_PATH))
-
-from fx_kline.core.ohlc_aggregator import main
+from scripts._bootstrap import ensure_src_on_path
 
+ensure_src_on_path()
 
 if __name__ == "__main__":
+    # Imported here so importing this module does not pull in pandas
+    from fx_kline.core.ohlc_aggregator import main
+
     raise SystemExit(main())
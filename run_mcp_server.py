@@ -10,16 +10,22 @@ Or with uv:
 """
 
 import asyncio
-import sys
-from pathlib import Path
+
+from scripts._bootstrap import ensure_src_on_path
 
 # Note: This path manipulation is required when the package is not installed in editable mode.
 # Without this, `uv run python run_mcp_server.py` would fail with ModuleNotFoundError.
 # Alternative: Install package in editable mode with `uv pip install -e .`
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
-
-from fx_kline.mcp.server import main
+ensure_src_on_path()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Imported here so importing this module does not pull in the MCP/pandas stack
+    from fx_kline.mcp.server import main
+
+    # uvloop is an optional speed-up (not available on Windows)
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
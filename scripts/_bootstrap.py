@@ -0,0 +1,21 @@
+"""
+Shared sys.path setup for script entry points.
+
+Makes ``src/`` importable when the package is not installed in editable mode.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = REPO_ROOT / "src"
+
+
+def ensure_src_on_path() -> Path:
+    """Insert ``src/`` at the front of sys.path once and return it."""
+    src = str(SRC_PATH)
+    if src not in sys.path:
+        sys.path.insert(0, src)
+    return SRC_PATH
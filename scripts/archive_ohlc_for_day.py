@@ -1,53 +1,78 @@
 #!/usr/bin/env python3
 """
-Archive previous-day 15m OHLC into data/YYYY/MM/DD/ohlc/.
+Archive previous-day 15m OHLC into data/YYYY/MM/DD/ohlc/ (Parquet by default, optionally CSV).
 """
 
 from __future__ import annotations
 
 import argparse
 import os
-import sys
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, time, timedelta
 from pathlib import Path
 from typing import Optional, Sequence
 
 import pandas as pd
 
-REPO_ROOT = Path(__file__).resolve().parents[1]
-SRC_PATH = REPO_ROOT / "src"
-if str(SRC_PATH) not in sys.path:
-    sys.path.insert(0, str(SRC_PATH))
+try:
+    from scripts._bootstrap import ensure_src_on_path
+except ModuleNotFoundError:  # run directly as `python scripts/<name>.py`
+    from _bootstrap import ensure_src_on_path
+
+ensure_src_on_path()
 
 from fx_kline.analyst import data_manager  # noqa: E402
 from fx_kline.core import data_fetcher  # noqa: E402
 from fx_kline.core.business_days import is_business_day  # noqa: E402
+from fx_kline.core.fast_csv import write_ohlc_csv  # noqa: E402
 from fx_kline.core.timezone_utils import JST_TZ  # noqa: E402
 from fx_kline.core.validators import get_preset_pairs  # noqa: E402
 
 DEFAULT_PAIRS = ["USDJPY", "EURUSD", "AUDJPY", "AUDUSD", "EURJPY", "XAUUSD"]
 DEFAULT_TIMEFRAME = "15m"
+DEFAULT_FILE_FORMAT = "parquet"
 
 
 def _parse_market_date(date_str: str) -> date:
     return datetime.strptime(date_str, "%Y-%m-%d").date()
 
 
+@lru_cache(maxsize=1)
+def _preset_pairs_cached() -> tuple[tuple[str, ...], frozenset[str]]:
+    # Ordered tuple for the fallback list, frozenset for O(1) membership checks
+    preset = tuple(get_preset_pairs())
+    return preset, frozenset(preset)
+
+
 def _default_pairs() -> list[str]:
     env_pairs = os.environ.get("PAIRS")
     if env_pairs:
         return env_pairs.split()
     # Fall back to the preset list but keep parity with the current workflow defaults
-    preset = get_preset_pairs()
-    return [p for p in DEFAULT_PAIRS if p in preset] or preset
+    preset, preset_set = _preset_pairs_cached()
+    return [p for p in DEFAULT_PAIRS if p in preset_set] or list(preset)
 
 
 def _jst_datetime(day: date) -> datetime:
     """Create a JST datetime for the start of the given date."""
-    return JST_TZ.localize(datetime.combine(day, time.min))
+    return datetime.combine(day, time.min, tzinfo=JST_TZ)
 
 
-def archive_for_target_date(market_date: date, pairs: list[str], timeframe: str = DEFAULT_TIMEFRAME) -> None:
+def _write_ohlc(df: pd.DataFrame, out_path: Path, file_format: str) -> None:
+    if file_format == "parquet":
+        # Parquet keeps the tz-aware index and dtypes, so readers skip date re-parsing
+        df.to_parquet(out_path, engine="pyarrow", compression="zstd", index=True)
+    else:
+        write_ohlc_csv(df, out_path)
+
+
+def archive_for_target_date(
+    market_date: date,
+    pairs: list[str],
+    timeframe: str = DEFAULT_TIMEFRAME,
+    file_format: str = DEFAULT_FILE_FORMAT,
+) -> None:
     target_date = market_date - timedelta(days=1)
     
     # Adjust target_date to previous business day if it falls on a weekend
@@ -61,26 +86,30 @@ def archive_for_target_date(market_date: date, pairs: list[str], timeframe: str
     
     start_jst = _jst_datetime(target_date - timedelta(days=1))
     end_jst = _jst_datetime(market_date)
-
+    day_start = _jst_datetime(target_date)
+    day_end = _jst_datetime(target_date + timedelta(days=1))
+
+    try:
+        frames = data_fetcher.fetch_ohlc_range_multi(
+            pairs=pairs,
+            interval=timeframe,
+            start=start_jst,
+            end=end_jst,
+            exclude_weekends=True,
+        )
+    except Exception as exc:  # pylint: disable=broad-except
+        print(f"[WARN] Failed to fetch {timeframe} data for {' '.join(pairs)}: {exc}")
+        return
+
+    tasks: list[tuple[str, pd.DataFrame, Path]] = []
     for pair in pairs:
-        try:
-            df = data_fetcher.fetch_ohlc_range_dataframe(
-                pair=pair,
-                interval=timeframe,
-                start=start_jst,
-                end=end_jst,
-                exclude_weekends=True,
-            )
-        except Exception as exc:  # pylint: disable=broad-except
-            print(f"[WARN] Failed to fetch {pair} {timeframe} data: {exc}")
-            continue
-
-        if df.empty:
+        df = frames.get(pair)
+        if df is None or df.empty:
             print(f"[WARN] No data returned for {pair} {timeframe} in window {start_jst} - {end_jst}")
             continue
 
-        # Restrict to the target day in JST
-        df_target = df[df.index.date == target_date]
+        # Restrict to the target day in JST (half-open range on the native datetime64 index)
+        df_target = df[(df.index >= day_start) & (df.index < day_end)]
         if df_target.empty:
             print(f"[WARN] No {timeframe} data for {pair} on target date {target_date}")
             continue
@@ -88,9 +117,24 @@ def archive_for_target_date(market_date: date, pairs: list[str], timeframe: str
         df_target = df_target.rename(columns=str.lower)
         df_target.index.name = "datetime"
 
-        out_path = data_manager.get_daily_ohlc_filepath(target_date, pair, timeframe)
-        df_target.to_csv(out_path, index=True)
-        print(f"[OK] Archived {pair} {timeframe} -> {out_path}")
+        out_path = data_manager.get_daily_ohlc_filepath(target_date, pair, timeframe, file_format)
+        tasks.append((pair, df_target, out_path))
+
+    if not tasks:
+        return
+
+    # Small per-pair files are disk-bound; overlap the writes instead of serialising them
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = {
+            executor.submit(_write_ohlc, df_target, out_path, file_format): (pair, out_path)
+            for pair, df_target, out_path in tasks
+        }
+        for future, (pair, out_path) in futures.items():
+            exc = future.exception()
+            if exc is not None:
+                print(f"[WARN] Failed to write {pair} {timeframe} data to {out_path}: {exc}")
+                continue
+            print(f"[OK] Archived {pair} {timeframe} -> {out_path}")
 
 
 def main(argv: Optional[Sequence[str]] = None) -> int:
@@ -112,12 +156,19 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         default=DEFAULT_TIMEFRAME,
         help="Timeframe to fetch (default: 15m).",
     )
+    parser.add_argument(
+        "--format",
+        dest="file_format",
+        choices=data_manager.OHLC_FILE_FORMATS,
+        default=DEFAULT_FILE_FORMAT,
+        help="Archive file format (default: parquet).",
+    )
 
     args = parser.parse_args(argv)
 
     market_date = _parse_market_date(args.market_date)
     pairs = args.pairs if args.pairs else _default_pairs()
-    archive_for_target_date(market_date, pairs, timeframe=args.timeframe)
+    archive_for_target_date(market_date, pairs, timeframe=args.timeframe, file_format=args.file_format)
     return 0
 
 
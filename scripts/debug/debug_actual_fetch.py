@@ -101,9 +101,9 @@ def debug_single_fetch_detailed(pair, interval, period):
         print(f"  Condition met: {len(unique_days)} > {expected_business_days}")
         # Sort unique_days before slicing to ensure correct chronological order
         unique_days = sorted(unique_days)
-        keep_days = set(unique_days[-expected_business_days:])
+        keep_days = unique_days[-expected_business_days:]
         print(f"  Keep last {expected_business_days} days:")
-        for day in sorted(keep_days):
+        for day in keep_days:
             print(f"    {day}")
 
         print(f"\n  Applying filter: normalized_index.isin(keep_days)")
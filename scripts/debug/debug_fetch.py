@@ -37,15 +37,19 @@ ohlc_columns = ['Open', 'High', 'Low', 'Close']
 if 'Volume' in df.columns:
     ohlc_columns.append('Volume')
 
-df_ohlc = df[ohlc_columns].copy()
+# Read-only inspection; a column selection is enough, no copy needed
+df_ohlc = df[ohlc_columns]
 
 print(f"Selected columns: {df_ohlc.columns.tolist()}")
 print(f"df_ohlc shape: {df_ohlc.shape}")
 print(f"\nFirst row iteration:")
-for idx, row in df_ohlc.head(1).iterrows():
+first_row = next(df_ohlc.head(1).itertuples(index=True, name=None), None)
+if first_row is None:
+    print("  (no rows returned)")
+else:
+    idx, open_, high, low, close, *rest = first_row
     print(f"  idx: {idx} (type: {type(idx)})")
-    print(f"  row type: {type(row)}")
-    print(f"  row.Open: {row['Open']} (type: {type(row['Open'])})")
-    print(f"  row['Open'] value: {row['Open']}")
-    if hasattr(row['Open'], 'item'):
-        print(f"  row['Open'].item(): {row['Open'].item()}")
+    print(f"  Open: {open_} (type: {type(open_)})")
+    print(f"  High: {high}  Low: {low}  Close: {close}")
+    if rest:
+        print(f"  Volume: {rest[0]}")
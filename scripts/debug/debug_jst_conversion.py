@@ -34,7 +34,7 @@ def main() -> int:
     print("Test 1: JST datetime creation")
     print("-" * 70)
     test_date = date(2025, 11, 28)
-    jst_dt = JST_TZ.localize(datetime.combine(test_date, time.min))
+    jst_dt = datetime.combine(test_date, time.min, tzinfo=JST_TZ)
     print(f"Input date: {test_date}")
     print(f"JST datetime: {jst_dt}")
     print(f"Timezone: {jst_dt.tzinfo}")
@@ -46,8 +46,8 @@ def main() -> int:
     # Test 2: Verify UTC conversion for API call
     print("Test 2: UTC conversion for API call")
     print("-" * 70)
-    start_jst = JST_TZ.localize(datetime.combine(test_date - timedelta(days=1), time.min))
-    end_jst = JST_TZ.localize(datetime.combine(test_date, time.min))
+    start_jst = datetime.combine(test_date - timedelta(days=1), time.min, tzinfo=JST_TZ)
+    end_jst = datetime.combine(test_date, time.min, tzinfo=JST_TZ)
     print(f"Start JST: {start_jst}")
     print(f"End JST: {end_jst}")
 
@@ -75,8 +75,8 @@ def main() -> int:
 
     try:
         # Use a small window to minimize API calls
-        start_jst = JST_TZ.localize(datetime.combine(test_date - timedelta(days=2), time.min))
-        end_jst = JST_TZ.localize(datetime.combine(test_date, time.min))
+        start_jst = datetime.combine(test_date - timedelta(days=2), time.min, tzinfo=JST_TZ)
+        end_jst = datetime.combine(test_date, time.min, tzinfo=JST_TZ)
 
         df = data_fetcher.fetch_ohlc_range_dataframe(
             pair="USDJPY",
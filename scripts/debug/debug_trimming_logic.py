@@ -3,10 +3,10 @@ Debug script to understand the trimming logic issue
 """
 
 import pandas as pd
-import pytz
+from zoneinfo import ZoneInfo
 from datetime import datetime, timedelta
 
-JST_TZ = pytz.timezone('Asia/Tokyo')
+JST_TZ = ZoneInfo('Asia/Tokyo')
 
 def simulate_trimming_issue():
     """Simulate the trimming logic to understand the issue"""
@@ -59,9 +59,9 @@ def simulate_trimming_issue():
 
     # Step 3: Keep last N days
     if len(unique_days) > expected_business_days:
-        keep_days = set(unique_days[-expected_business_days:])
+        keep_days = unique_days[-expected_business_days:]
         print(f"\nStep 3: Keep last {expected_business_days} days:")
-        for day in sorted(keep_days):
+        for day in keep_days:
             print(f"  {day}")
 
         # Step 4: Filter data
@@ -7,16 +7,17 @@ from __future__ import annotations
 
 import argparse
 import shutil
-import sys
 from datetime import datetime, date
 from pathlib import Path
 from typing import Optional, Sequence
 
 # Ensure src/ is importable when running as a standalone script
-REPO_ROOT = Path(__file__).resolve().parents[1]
-SRC_PATH = REPO_ROOT / "src"
-if str(SRC_PATH) not in sys.path:
-    sys.path.insert(0, str(SRC_PATH))
+try:
+    from scripts._bootstrap import ensure_src_on_path
+except ModuleNotFoundError:  # run directly as `python scripts/<name>.py`
+    from _bootstrap import ensure_src_on_path
+
+ensure_src_on_path()
 
 from fx_kline.analyst import data_manager  # noqa: E402
 from fx_kline.core.timezone_utils import get_jst_now  # noqa: E402
@@ -6,21 +6,30 @@ Run L3 evaluation for a given target date.
 from __future__ import annotations
 
 import argparse
-import json
-import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Dict, Optional, Sequence
 
 import pandas as pd
 
-REPO_ROOT = Path(__file__).resolve().parents[1]
-SRC_PATH = REPO_ROOT / "src"
-if str(SRC_PATH) not in sys.path:
-    sys.path.insert(0, str(SRC_PATH))
+try:
+    from scripts._bootstrap import ensure_src_on_path
+except ModuleNotFoundError:  # run directly as `python scripts/<name>.py`
+    from _bootstrap import ensure_src_on_path
+
+ensure_src_on_path()
 
 from fx_kline.analyst import data_manager  # noqa: E402
 from fx_kline.analyst.l3_evaluator import L3Evaluator  # noqa: E402
+from fx_kline.core import json_utils  # noqa: E402
+
+# pyarrow's multithreaded CSV parser is much faster; fall back to the C engine when absent
+_CSV_ENGINE = "pyarrow" if find_spec("pyarrow") is not None else "c"
+# Prices stay float64: SL/TP/zone levels from the L3 JSON are float64, and float32 bars would
+# miss exact touches (float32(155.123) > 155.123)
+_OHLC_DTYPES = {"open": "float64", "high": "float64", "low": "float64", "close": "float64"}
 
 
 def _parse_date(value: str) -> date:
@@ -28,8 +37,7 @@ def _parse_date(value: str) -> date:
 
 
 def _load_json(path: Path) -> Dict:
-    with path.open("r", encoding="utf-8") as fp:
-        return json.load(fp)
+    return json_utils.load_json_file(path)
 
 
 def _load_prediction(pred_date: date) -> Dict:
@@ -39,24 +47,48 @@ def _load_prediction(pred_date: date) -> Dict:
     return _load_json(pred_path)
 
 
+def _read_ohlc_file(path: Path) -> pd.DataFrame:
+    if path.suffix == ".parquet":
+        # Parquet preserves lowercase columns and the tz-aware JST index
+        return pd.read_parquet(path)
+
+    # names=/index_col= break the pyarrow engine's output finalisation, so the columns are
+    # lowercased and the index set after parsing
+    df = pd.read_csv(path, engine=_CSV_ENGINE, parse_dates=["datetime"], dtype=_OHLC_DTYPES)
+    if df.empty:
+        return df
+    df = df.rename(columns=str.lower)
+    df = df.set_index("datetime")
+    if df.index.tzinfo is None:
+        df.index = df.index.tz_localize("Asia/Tokyo")
+    else:
+        df.index = df.index.tz_convert("Asia/Tokyo")
+    return df
+
+
 def _load_market_data(pred_date: date) -> Dict[str, pd.DataFrame]:
     ohlc_dir = data_manager.get_daily_ohlc_dir(pred_date)
     market_data: Dict[str, pd.DataFrame] = {}
     if not ohlc_dir.exists():
         return market_data
 
-    for csv_path in sorted(ohlc_dir.glob("*_15m.csv")):
-        pair = csv_path.stem.split("_")[0]
-        df = pd.read_csv(csv_path, parse_dates=["datetime"])
-        if df.empty:
-            continue
-        df = df.rename(columns=str.lower)
-        df = df.set_index("datetime")
-        if df.index.tzinfo is None:
-            df.index = df.index.tz_localize("Asia/Tokyo")
-        else:
-            df.index = df.index.tz_convert("Asia/Tokyo")
-        market_data[pair] = df
+    # Prefer Parquet when both formats were archived for the same pair
+    ohlc_paths: Dict[str, Path] = {}
+    for file_format in ("csv", "parquet"):
+        for path in sorted(ohlc_dir.glob(f"*_15m.{file_format}")):
+            ohlc_paths[path.stem.split("_")[0]] = path
+
+    if not ohlc_paths:
+        return market_data
+
+    # Per-pair files are independent; read_csv releases the GIL while parsing
+    pairs = sorted(ohlc_paths)
+    with ThreadPoolExecutor(max_workers=len(pairs)) as executor:
+        frames = executor.map(_read_ohlc_file, (ohlc_paths[pair] for pair in pairs))
+        for pair, df in zip(pairs, frames):
+            if df.empty:
+                continue
+            market_data[pair] = df
     return market_data
 
 
@@ -66,8 +98,16 @@ def _load_atr_from_summaries(pred_date: date) -> Dict[str, float]:
     if not summaries_dir.exists():
         return atr_map
 
-    for path in summaries_dir.glob("*_summary.json"):
-        data = _load_json(path)
+    summary_paths = sorted(summaries_dir.glob("*_summary.json"))
+    if not summary_paths:
+        return atr_map
+
+    # Summaries are small, so open/read latency dominates: read in threads, parse here
+    with ThreadPoolExecutor(max_workers=len(summary_paths)) as executor:
+        raw_summaries = list(executor.map(Path.read_bytes, summary_paths))
+
+    for raw in raw_summaries:
+        data = json_utils.loads(raw)
         pair = data.get("pair")
         tf_1d = data.get("timeframes", {}).get("1d", {})
         atr_val = tf_1d.get("atr")
@@ -78,9 +118,14 @@ def _load_atr_from_summaries(pred_date: date) -> Dict[str, float]:
 
 def run_for_target_date(target_date: date) -> Dict:
     prediction_date = target_date - timedelta(days=1)
-    l3_json = _load_prediction(prediction_date)
-    market_data = _load_market_data(prediction_date)
-    atr_data = _load_atr_from_summaries(prediction_date)
+    # The three inputs live in separate files and are independent, so overlap their I/O
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        l3_future = executor.submit(_load_prediction, prediction_date)
+        market_future = executor.submit(_load_market_data, prediction_date)
+        atr_future = executor.submit(_load_atr_from_summaries, prediction_date)
+        l3_json = l3_future.result()
+        market_data = market_future.result()
+        atr_data = atr_future.result()
 
     evaluator = L3Evaluator(l3_json=l3_json, market_data=market_data, atr_data=atr_data)
     results = evaluator.run()
@@ -88,8 +133,7 @@ def run_for_target_date(target_date: date) -> Dict:
     out_dir = data_manager.get_daily_data_dir(target_date)
     out_dir.mkdir(parents=True, exist_ok=True)
     out_path = out_dir / "L3_evaluation.json"
-    with out_path.open("w", encoding="utf-8") as fp:
-        json.dump(results, fp, ensure_ascii=True, indent=2, default=str)
+    json_utils.dump_json_file(results, out_path, indent=2, default=str, ensure_ascii=True)
     return {"output_path": out_path, "results": results}
 
 
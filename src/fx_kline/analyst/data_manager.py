@@ -7,6 +7,9 @@ from __future__ import annotations
 from datetime import date
 from pathlib import Path
 
+# Supported on-disk formats for archived OHLC (Parquet requires pyarrow)
+OHLC_FILE_FORMATS = ("csv", "parquet")
+
 
 def _project_root() -> Path:
     """Return the repository root based on this file location."""
@@ -49,10 +52,13 @@ def get_daily_ohlc_dir(day: date) -> Path:
     return target
 
 
-def get_daily_ohlc_filepath(day: date, pair: str, timeframe: str = "15m") -> Path:
+def get_daily_ohlc_filepath(day: date, pair: str, timeframe: str = "15m", file_format: str = "csv") -> Path:
     """
-    File path for an OHLC CSV: data/YYYY/MM/DD/ohlc/{PAIR}_{timeframe}.csv
+    File path for an OHLC archive: data/YYYY/MM/DD/ohlc/{PAIR}_{timeframe}.{csv|parquet}
     """
+    if file_format not in OHLC_FILE_FORMATS:
+        raise ValueError(f"Unsupported OHLC file format: {file_format}")
+
     # Sanitize pair and timeframe to prevent path traversal and invalid characters
     safe_pair = pair.replace("/", "_").replace("\\", "_")
     safe_timeframe = timeframe.replace("/", "_").replace("\\", "_")
@@ -61,10 +67,11 @@ def get_daily_ohlc_filepath(day: date, pair: str, timeframe: str = "15m") -> Pat
     if ".." in safe_pair or ".." in safe_timeframe:
         raise ValueError(f"Invalid characters in pair or timeframe: {pair}, {timeframe}")
 
-    return get_daily_ohlc_dir(day) / f"{safe_pair}_{safe_timeframe}.csv"
+    return get_daily_ohlc_dir(day) / f"{safe_pair}_{safe_timeframe}.{file_format}"
 
 
 __all__ = [
+    "OHLC_FILE_FORMATS",
     "get_data_root",
     "get_daily_data_dir",
     "get_daily_summaries_dir",
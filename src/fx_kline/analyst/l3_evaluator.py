@@ -4,10 +4,149 @@ L3 evaluation utilities.
 
 from __future__ import annotations
 
+import time
 import numpy as np
 import pandas as pd
 from datetime import datetime
-from typing import Any, Dict
+from functools import lru_cache
+from itertools import product
+from typing import Any, Dict, Optional
+
+# simulate_trades の結果コード（カーネルは整数で返し、文字列化は呼び出し側で行う）
+_OUTCOME_HOLD = 0
+_OUTCOME_WIN = 1
+_OUTCOME_LOSS = 2
+_OUTCOME_LABELS = ("HOLD", "WIN", "LOSS")
+
+# 日付インデックス用（datetime64[ns] の整数値を日単位に切り捨てる）
+_NS_PER_DAY = 86_400_000_000_000
+_NS_PER_HOUR = 3_600_000_000_000
+_JST_OFFSET_NS = 9 * _NS_PER_HOUR
+
+# セッション時間帯（JST、[開始, 終了) 時。開始 > 終了 は日付またぎ）
+_SESSION_HOURS = {"TOKYO": (9, 15), "LONDON": (16, 21)}
+
+
+def _hour_lut(start: int, end: int) -> np.ndarray:
+    """時 (0-23) -> [start, end) に入るか の 24 要素ルックアップテーブル"""
+    hours = np.arange(24)
+    if start <= end:
+        return (hours >= start) & (hours < end)
+    return (hours >= start) | (hours < end)
+
+
+# セッション名ごとの LUT（import 時に1回だけ作る）
+_SESSION_HOUR_LUT = {name: _hour_lut(*hours) for name, hours in _SESSION_HOURS.items()}
+
+# 有効セッションの組み合わせ（_SESSION_HOUR_LUT の順に bool）ごとの合成 LUT も事前計算し、
+# 戦略ごとには時刻配列をそのまま引くだけにする
+_SESSION_LUTS = {
+    enabled: np.logical_or.reduce(
+        [np.zeros(24, dtype=bool)]
+        + [lut for lut, on in zip(_SESSION_HOUR_LUT.values(), enabled) if on]
+    )
+    for enabled in product((False, True), repeat=len(_SESSION_HOUR_LUT))
+}
+
+
+def _session_key(valid_sessions) -> tuple[bool, ...]:
+    """戦略の valid_sessions -> _SESSION_LUTS のキー"""
+    return tuple(name in valid_sessions for name in _SESSION_HOUR_LUT)
+
+# 1 pip = 0.01 の円クロス（それ以外は 0.0001）
+_JPY_PAIRS = frozenset({"USDJPY", "EURJPY", "GBPJPY", "AUDJPY", "NZDJPY", "CADJPY", "CHFJPY"})
+
+
+@lru_cache(maxsize=128)
+def _pip_multiplier(pair: str) -> int:
+    """価格差を pips に換算する倍率（未登録の円クロスは末尾 JPY で判定）"""
+    return 100 if pair in _JPY_PAIRS or pair.endswith("JPY") else 10000
+
+
+@lru_cache(maxsize=1)
+def _format_local_second(epoch_second: int) -> str:
+    return datetime.fromtimestamp(epoch_second).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _evaluation_timestamp() -> str:
+    """現在時刻の文字列（同じ秒の間はフォーマット済みの値を使い回す）"""
+    return _format_local_second(int(time.time()))
+
+
+@lru_cache(maxsize=64)
+def _parse_version_tuple(raw: str) -> tuple[int, ...] | None:
+    """"2.2" -> (2, 2)。解析できなければ None（同じ文字列は使い回す）"""
+    try:
+        return tuple(int(p) for p in raw.split("."))
+    except Exception:
+        return None
+
+
+def _is_version_gte(version: tuple[int, ...] | None, target: tuple[int, ...]) -> bool:
+    """version >= target（短い方は 0 埋めして比較）"""
+    if version is None:
+        return False
+    max_len = max(len(version), len(target))
+    v = list(version) + [0] * (max_len - len(version))
+    t = list(target) + [0] * (max_len - len(target))
+    return v >= t
+
+
+def _simulate_batch(
+    day_ns: np.ndarray,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    session_masks: np.ndarray,
+    zone_min: np.ndarray,
+    zone_max: np.ndarray,
+    stop_loss: np.ndarray,
+    take_profit: np.ndarray,
+    entry_price: np.ndarray,
+    is_long: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    同一ペア・同一日の k 戦略をまとめて (k, バー数) の行列でシミュレーションする。
+
+    戦略ごとの値はすべて長さ k の配列、session_masks は (k, バー数)。
+    エントリーはセッション内でゾーンに最初に触れたバー、決済はそれ以降の
+    バーで SL/TP に最初に触れたバー（同一バーで両方なら SL 優先）、
+    どちらにも触れなければ最終クローズで評価する。
+
+    戻り値: (entry_idx（未約定は -1）, outcome_code, pnl)
+    """
+    n = len(closes)
+    hits = session_masks & (lows <= zone_max[:, None]) & (highs >= zone_min[:, None])
+    entered = hits.any(axis=1)
+    entry_idx = np.where(entered, hits.argmax(axis=1), -1)
+
+    # エントリーより後のバー（未約定の行はすべて False）
+    post = (day_ns > day_ns[entry_idx][:, None]) & entered[:, None]
+    # LONG 行と SHORT 行は必要な側の比較だけを行う（両側を計算して np.where で選ばない）
+    short = ~is_long
+    sl_hits = np.empty_like(post)
+    tp_hits = np.empty_like(post)
+    sl_hits[is_long] = lows <= stop_loss[is_long, None]
+    sl_hits[short] = highs >= stop_loss[short, None]
+    tp_hits[is_long] = highs >= take_profit[is_long, None]
+    tp_hits[short] = lows <= take_profit[short, None]
+    sl_hits &= post
+    tp_hits &= post
+    sl_i = np.where(sl_hits.any(axis=1), sl_hits.argmax(axis=1), n)
+    tp_i = np.where(tp_hits.any(axis=1), tp_hits.argmax(axis=1), n)
+
+    loss = (sl_i < n) & (sl_i <= tp_i)
+    win = ~loss & (tp_i < n)
+    has_post = post.any(axis=1)
+    last_post = n - 1 - post[:, ::-1].argmax(axis=1)
+
+    outcome = np.select([loss, win], [_OUTCOME_LOSS, _OUTCOME_WIN], _OUTCOME_HOLD)
+    exit_price = np.select([loss, win], [stop_loss, take_profit], closes[last_post])
+    # 符号を掛けると SHORT の損益 0 が -0.0 になるため、方向ごとに引き算する
+    pnl = np.where(is_long, exit_price - entry_price, entry_price - exit_price)
+    # エントリー後のバーがなければ損益 0
+    pnl = np.where(has_post, pnl, 0.0)
+    return entry_idx, outcome, pnl
 
 
 class L3Evaluator:
@@ -32,13 +171,24 @@ class L3Evaluator:
         self.market_data = market_data
         self.atr_data = atr_data
 
+        # ペアごとの壁時計 ns / 日付ラベル / 日足集計キャッシュ（_ensure_daily_cache で遅延計算）
+        self._wall_ns: Dict[str, np.ndarray] = {}
+        self._day_index: Dict[str, np.ndarray] = {}
+        self._daily_cache: Dict[str, tuple[np.ndarray, np.ndarray]] = {}
+
         # meta.generated_at は "2025-11-27 09:00:00 JST" を想定
         try:
             self.generated_at = pd.to_datetime(l3_json["meta"]["generated_at"])
             self.target_date = self.generated_at.date()
+            self._target_day = pd.Timestamp(self.target_date).value // _NS_PER_DAY
         except KeyError as e:
             raise ValueError(f"Required key missing in l3_json: {e}")
 
+        # 全戦略で共通の meta.schema_version は1回だけ解析しておく
+        self._meta_schema_version = _parse_version_tuple(
+            str(l3_json.get("meta", {}).get("schema_version"))
+        )
+
         # strategy_type から期待される方向
         self.DIRECTION_BY_TYPE = {
             "DIP_BUY": "LONG",
@@ -49,7 +199,7 @@ class L3Evaluator:
         # 評価結果の器
         self.results: Dict[str, Any] = {
             "meta": {
-                "evaluation_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "evaluation_date": _evaluation_timestamp(),
                 "target_date": str(self.target_date),
                 "source_generated_at": l3_json["meta"]["generated_at"],
                 "version": "l3_evaluation_v1.0",
@@ -87,21 +237,67 @@ class L3Evaluator:
     # ヘルパー
     # ==========
 
-    def _get_daily_stats(self, pair: str):
-        """指定ペアの当日日足統計を取得"""
+    def _get_wall_ns(self, pair: str) -> np.ndarray:
+        """各バーの現地（JST）壁時計時刻を 1970-01-01 からの ns (int64) で取得"""
+        wall_ns = self._wall_ns.get(pair)
+        if wall_ns is None:
+            idx = self.market_data[pair].index.as_unit("ns")
+            if idx.tz is None:
+                wall_ns = idx.asi8
+            elif str(idx.tz) == "Asia/Tokyo":
+                # JST は固定オフセット（夏時間なし）なので UTC ns に 9 時間足すだけでよい
+                wall_ns = idx.asi8 + _JST_OFFSET_NS
+            else:
+                wall_ns = idx.tz_localize(None).asi8
+            self._wall_ns[pair] = wall_ns
+        return wall_ns
+
+    def _get_day_index(self, pair: str) -> np.ndarray:
+        """各バーの JST 日付を 1970-01-01 からの通算日数 (int64) で取得"""
+        days = self._day_index.get(pair)
+        if days is None:
+            days = self._get_wall_ns(pair) // _NS_PER_DAY
+            self._day_index[pair] = days
+        return days
+
+    def _ensure_daily_cache(self, pair: str) -> tuple[np.ndarray, np.ndarray] | None:
+        """
+        ペアの日足集計を1回の groupby で作りキャッシュ
+
+        Returns:
+            (昇順の通算日数, [open, close, high, low] の (日数, 4) float 配列)
+        """
         if pair not in self.market_data:
             return None
 
-        df = self.market_data[pair]
-        daily_df = df[df.index.date == self.target_date]
+        daily = self._daily_cache.get(pair)
+        if daily is None:
+            df = self.market_data[pair]
+            days = self._get_day_index(pair)
+            agg = df.groupby(days).agg(high=("high", "max"), low=("low", "min"))
+            # 始値/終値は "first"/"last" だと NaN を飛ばすため、位置で先頭/末尾バーを取る
+            by_day = pd.DataFrame(
+                {"open": df["open"].to_numpy(), "close": df["close"].to_numpy()}, index=days
+            ).groupby(level=0)
+            agg.insert(0, "close", by_day["close"].nth(-1).reindex(agg.index))
+            agg.insert(0, "open", by_day["open"].nth(0).reindex(agg.index))
+            # 以降は行参照ごとの pandas .loc / Series 生成を避け、numpy 配列で引く
+            daily = (agg.index.to_numpy(), agg.to_numpy())
+            self._daily_cache[pair] = daily
+        return daily
 
-        if daily_df.empty:
+    def _get_daily_stats(self, pair: str):
+        """指定ペアの当日日足統計を取得"""
+        daily = self._ensure_daily_cache(pair)
+        if daily is None:
             return None
 
-        o = daily_df.iloc[0]["open"]
-        c = daily_df.iloc[-1]["close"]
-        h = daily_df["high"].max()
-        l = daily_df["low"].min()
+        days, ohlc = daily
+        pos = np.searchsorted(days, self._target_day)
+        if pos == len(days) or days[pos] != self._target_day:
+            return None
+
+        o, c, h, l = ohlc[pos]
 
         return {
             "open": o,
@@ -115,23 +311,19 @@ class L3Evaluator:
 
     def _get_prev_day_stats(self, pair: str):
         """前日の日足統計を取得（トレンド判定用）"""
-        if pair not in self.market_data:
+        daily = self._ensure_daily_cache(pair)
+        if daily is None:
             return None
 
-        df = self.market_data[pair]
-        prev_df = df[df.index.date < self.target_date]
-        if prev_df.empty:
-            return None
-
-        last_date = prev_df.index[-1].date()
-        target_prev = prev_df[prev_df.index.date == last_date]
-
-        if target_prev.empty:
+        days, ohlc = daily
+        # 対象日より前の最終日 = searchsorted の1つ手前
+        pos = np.searchsorted(days, self._target_day) - 1
+        if pos < 0:
             return None
 
         return {
-            "high": target_prev["high"].max(),
-            "low": target_prev["low"].min(),
+            "high": ohlc[pos, 2],
+            "low": ohlc[pos, 3],
         }
 
     def _resolve_direction(self, strat: Dict[str, Any]) -> tuple[str | None, str]:
@@ -149,32 +341,17 @@ class L3Evaluator:
         """
         stype = strat.get("strategy_type")
 
-        # schema_version は戦略個別、なければ L3 全体の meta から取得
+        # schema_version は戦略個別、なければ L3 全体の meta（__init__ で解析済み）
         raw_schema_version = strat.get("schema_version")
         if raw_schema_version is None:
-            raw_schema_version = self.l3.get("meta", {}).get("schema_version")
-
-        def _parse_version_tuple(raw: object) -> tuple[int, ...] | None:
-            try:
-                parts = [int(p) for p in str(raw).split(".")]
-                return tuple(parts)
-            except Exception:
-                return None
-
-        def _is_gte(version: tuple[int, ...] | None, target: tuple[int, ...]) -> bool:
-            if version is None:
-                return False
-            max_len = max(len(version), len(target))
-            v = list(version) + [0] * (max_len - len(version))
-            t = list(target) + [0] * (max_len - len(target))
-            return v >= t
-
-        schema_version = _parse_version_tuple(raw_schema_version)
+            schema_version = self._meta_schema_version
+        else:
+            schema_version = _parse_version_tuple(str(raw_schema_version))
 
         direction = strat.get("direction")
 
         # 1. 新スキーマ (>= 2.2) では direction 必須
-        if _is_gte(schema_version, (2, 2)):
+        if _is_version_gte(schema_version, (2, 2)):
             if direction not in ("LONG", "SHORT"):
                 return None, "REQUIRES_DIRECTION"
 
@@ -224,48 +401,39 @@ class L3Evaluator:
         vol_correct = 0
         vol_total = 0
 
+        # 日足統計は先にまとめて引き、ループ内はスカラー比較のみにする
+        daily_by_pair = {pair: self._get_daily_stats(pair) for pair in env_preds}
+        prev_by_pair = {pair: self._get_prev_day_stats(pair) for pair in env_preds}
+        atr_data = self.atr_data
+
         for pair, pred in env_preds.items():
-            stats = self._get_daily_stats(pair)
-            prev_stats = self._get_prev_day_stats(pair)
+            stats = daily_by_pair[pair]
+            prev_stats = prev_by_pair[pair]
 
             if not stats or not prev_stats:
                 per_pair[pair] = {"status": "NO_DATA"}
                 continue
 
-            atr = self.atr_data.get(pair)
+            atr = atr_data.get(pair)
             if not atr:
                 per_pair[pair] = {"status": "NO_ATR_DATA"}
                 continue
 
+            o = stats["open"]
+            c = stats["close"]
+            prev_high = prev_stats["high"]
+            prev_low = prev_stats["low"]
+
             # Volatility 判定
             vol_ratio = stats["range"] / atr
-            if vol_ratio <= 0.5:
-                actual_vol = "LOW"
-            elif vol_ratio >= 1.5:
-                actual_vol = "HIGH"
-            else:
-                actual_vol = "MEDIUM"
+            actual_vol = "LOW" if vol_ratio <= 0.5 else "HIGH" if vol_ratio >= 1.5 else "MEDIUM"
 
             # Bias 判定（元ロジック維持）
-            is_bull = (
-                (stats["close"] > stats["open"])
-                and (stats["close"] > prev_stats["high"])
-                and (actual_vol != "LOW")
-            )
-            is_bear = (
-                (stats["close"] < stats["open"])
-                and (stats["close"] < prev_stats["low"])
-                and (actual_vol != "LOW")
-            )
-            is_range = (stats["body_high"] <= prev_stats["high"]) and (
-                stats["body_low"] >= prev_stats["low"]
-            )
-
-            if is_bull:
+            if c > o and c > prev_high and actual_vol != "LOW":
                 actual_bias = "BULLISH"
-            elif is_bear:
+            elif c < o and c < prev_low and actual_vol != "LOW":
                 actual_bias = "BEARISH"
-            elif is_range:
+            elif stats["body_high"] <= prev_high and stats["body_low"] >= prev_low:
                 actual_bias = "RANGE"
             else:
                 actual_bias = "MIXED"
@@ -314,16 +482,22 @@ class L3Evaluator:
         if not top3 or not bottom3:
             return
 
-        def get_avg_range_ratio(pairs):
-            vals = []
-            for p in pairs:
-                s = self._get_daily_stats(p)
-                if s and s["open"] != 0:
-                    vals.append(s["range"] / s["open"])
-            return float(np.mean(vals)) if vals else None
+        # top3 / bottom3 のレンジ比率を1本の配列にまとめ、グループ別に平均する
+        stats_by_pair = {p: self._get_daily_stats(p) for p in (*top3, *bottom3)}
 
-        avg_top = get_avg_range_ratio(top3)
-        avg_bottom = get_avg_range_ratio(bottom3)
+        def range_ratios(pairs):
+            return [
+                s["range"] / s["open"]
+                for s in map(stats_by_pair.get, pairs)
+                if s and s["open"] != 0
+            ]
+
+        top_ratios = range_ratios(top3)
+        ratios = np.array(top_ratios + range_ratios(bottom3), dtype=np.float64)
+        n_top = len(top_ratios)
+
+        avg_top = float(ratios[:n_top].mean()) if n_top else None
+        avg_bottom = float(ratios[n_top:].mean()) if ratios.size > n_top else None
         ratio = None
         if avg_top is not None and avg_bottom not in (None, 0):
             ratio = avg_top / avg_bottom
@@ -338,14 +512,49 @@ class L3Evaluator:
     # ③ 戦略シミュレーション
     # =====================
 
+    def _get_day_arrays(self, pair: str) -> Optional[tuple]:
+        """
+        対象日のデータをシミュレーション用の配列にまとめる（データなしは None）
+
+        Returns:
+            (index, index の int64 ns, 時 (0-23), high, low, close)
+        """
+        df = self.market_data[pair]
+        positions = np.flatnonzero(self._get_day_index(pair) == self._target_day)
+        if not positions.size:
+            return None
+
+        # DataFrame をブールマスクで切り出さず、必要な列だけを位置で取る。
+        # 時系列順に並んでいれば対象日は連続区間なので、スライス（コピーなしのビュー）で済む
+        first, last = positions[0], positions[-1]
+        if last - first + 1 == positions.size:
+            positions = slice(first, last + 1)
+
+        day_index = df.index[positions]
+        # 時は壁時計 ns から整数演算で出す（DatetimeIndex.hour のタイムゾーン変換を避ける）
+        hours = self._get_wall_ns(pair)[positions] % _NS_PER_DAY // _NS_PER_HOUR
+        return (
+            day_index,
+            day_index.asi8,
+            hours,
+            df["high"].to_numpy()[positions],
+            df["low"].to_numpy()[positions],
+            df["close"].to_numpy()[positions],
+        )
+
     def simulate_trades(self):
         strategies = self.l3.get("strategies", [])
-        per_pair = {}
         num_strats = len(strategies)
         total_pips = 0.0
         filled_count = 0
         win_tp_count = 0
 
+        # 1 パス目: 方向・データ有無を判定し、シミュレーション対象をペアごとにまとめる
+        # rows[i] は (pair, 確定済みの結果 or None)。None はペア単位の一括計算で埋める
+        rows: list[tuple[str, Optional[Dict[str, Any]]]] = []
+        pending: Dict[str, list[tuple[int, Dict[str, Any], bool]]] = {}
+        day_arrays: Dict[str, Optional[tuple]] = {}
+
         for strat in strategies:
             pair = strat["pair"]
             if pair not in self.market_data:
@@ -354,109 +563,93 @@ class L3Evaluator:
             # 戦略方向の決定（schema_version と strategy_type を考慮）
             direction, dir_status = self._resolve_direction(strat)
             if direction is None:
-                per_pair.setdefault(pair, []).append(
+                rows.append((
+                    pair,
                     {
                         "strategy_type": strat.get("strategy_type"),
                         "result": "UNSUPPORTED_DIRECTION",
                         "reason": dir_status,
                         "pnl_pips": 0.0,
-                    }
-                )
+                    },
+                ))
                 continue
 
-            df = self.market_data[pair]
-            day_df = df[df.index.date == self.target_date].copy()
-            if day_df.empty:
-                per_pair.setdefault(pair, []).append(
-                    {"result": "NO_MARKET_DATA", "pnl_pips": 0.0}
-                )
+            if pair not in day_arrays:
+                day_arrays[pair] = self._get_day_arrays(pair)
+            if day_arrays[pair] is None:
+                rows.append((pair, {"result": "NO_MARKET_DATA", "pnl_pips": 0.0}))
                 continue
 
-            valid_sessions = strat.get("valid_sessions", [])
-
-            # Tokyo: 9-15, London: 16-21 (JST)
-            session_mask = []
-            for t in day_df.index:
-                h = t.hour
-                is_tokyo = (9 <= h < 15) and ("TOKYO" in valid_sessions)
-                is_london = (16 <= h < 21) and ("LONDON" in valid_sessions)
-                session_mask.append(is_tokyo or is_london)
-
-            session_df = day_df[session_mask]
-
-            entry_conf = strat["entry"]
-            exit_conf = strat["exit"]
-
-            entry_triggered = False
-            entry_price = entry_conf["strict_limit"]
-            entry_time = None
-
-            # エントリー判定
-            for t, row in session_df.iterrows():
-                if (
-                    row["low"] <= entry_conf["zone_max"]
-                    and row["high"] >= entry_conf["zone_min"]
-                ):
-                    entry_triggered = True
-                    entry_time = t
-                    break
-
-            outcome = "NO_ENTRY"
-            pnl = 0.0
-
-            if entry_triggered:
-                filled_count += 1
-                post_entry = day_df[day_df.index > entry_time]
-                outcome = "HOLD"
-
-                for t, row in post_entry.iterrows():
-                    if direction == "LONG":
-                        # ロング：SL -> LOSS, TP -> WIN
-                        if row["low"] <= exit_conf["stop_loss"]:
-                            outcome = "LOSS"
-                            pnl = exit_conf["stop_loss"] - entry_price
-                            break
-
-                        if row["high"] >= exit_conf["take_profit"]:
-                            outcome = "WIN"
-                            pnl = exit_conf["take_profit"] - entry_price
-                            win_tp_count += 1
-                            break
-                    else:  # SHORT
-                        # ショート：SL -> LOSS, TP -> WIN
-                        if row["high"] >= exit_conf["stop_loss"]:
-                            outcome = "LOSS"
-                            pnl = entry_price - exit_conf["stop_loss"]
-                            break
-
-                        if row["low"] <= exit_conf["take_profit"]:
-                            outcome = "WIN"
-                            pnl = entry_price - exit_conf["take_profit"]
-                            win_tp_count += 1
-                            break
-
-                if outcome == "HOLD" and not post_entry.empty:
-                    # 最終クローズまで到達した場合の評価
-                    last_close = post_entry.iloc[-1]["close"]
-                    pnl = (
-                        last_close - entry_price
-                        if direction == "LONG"
-                        else entry_price - last_close
-                    )
-
-            multiplier = 100 if "JPY" in pair else 10000
-            pnl_pips = float(pnl * multiplier)
-            total_pips += pnl_pips
-
-            per_pair.setdefault(pair, []).append(
-                {
-                    "strategy_type": strat.get("strategy_type"),
-                    "entry_time": entry_time.isoformat() if entry_time else None,
-                    "entry_price": entry_price if entry_triggered else None,
-                    "result": outcome,
-                    "pnl_pips": round(pnl_pips, 1),
-                }
+            pending.setdefault(pair, []).append((len(rows), strat, direction == "LONG"))
+            rows.append((pair, None))
+
+        # 2 パス目: ペアごとに全戦略のエントリー/決済を行列演算で一括判定
+        pnl_by_row: Dict[int, float] = {}
+        for pair, items in pending.items():
+            day_index, day_ns, hours, highs, lows, closes = day_arrays[pair]
+            strats = [strat for _, strat, _ in items]
+            entries = [strat["entry"] for strat in strats]
+            exits = [strat["exit"] for strat in strats]
+            # 指値はシミュレーションと結果レコードの両方で使うので1回だけ取り出す
+            strict_limits = [e["strict_limit"] for e in entries]
+
+            # Tokyo: 9-15, London: 16-21 (JST) — ルックアップテーブルで判定。
+            # 同じセッション指定の戦略はバー単位のマスクを1回だけ作って共有する
+            mask_by_key: Dict[tuple[bool, ...], np.ndarray] = {}
+            session_rows = []
+            for strat in strats:
+                key = _session_key(strat.get("valid_sessions", []))
+                mask = mask_by_key.get(key)
+                if mask is None:
+                    mask = mask_by_key[key] = _SESSION_LUTS[key][hours]
+                session_rows.append(mask)
+            entry_idx, outcome_codes, pnls = _simulate_batch(
+                day_ns,
+                highs,
+                lows,
+                closes,
+                np.stack(session_rows),
+                np.array([e["zone_min"] for e in entries], dtype=np.float64),
+                np.array([e["zone_max"] for e in entries], dtype=np.float64),
+                np.array([x["stop_loss"] for x in exits], dtype=np.float64),
+                np.array([x["take_profit"] for x in exits], dtype=np.float64),
+                np.array(strict_limits, dtype=np.float64),
+                np.array([is_long for _, _, is_long in items], dtype=bool),
             )
+            # 行ごとの numpy スカラー参照を避け、列ごとに1回で Python 値へ変換
+            for (row_pos, strat, _), strict_limit, idx, code, pnl_pips in zip(
+                items,
+                strict_limits,
+                entry_idx.tolist(),
+                outcome_codes.tolist(),
+                (pnls * _pip_multiplier(pair)).tolist(),
+            ):
+                entry_triggered = idx >= 0
+                entry_time = None
+                if entry_triggered:
+                    filled_count += 1
+                    entry_time = day_index[idx].isoformat()
+                    if code == _OUTCOME_WIN:
+                        win_tp_count += 1
+
+                pnl_by_row[row_pos] = pnl_pips
+                rows[row_pos] = (
+                    pair,
+                    {
+                        "strategy_type": strat.get("strategy_type"),
+                        "entry_time": entry_time,
+                        "entry_price": strict_limit if entry_triggered else None,
+                        "result": _OUTCOME_LABELS[code] if entry_triggered else "NO_ENTRY",
+                        "pnl_pips": round(pnl_pips, 1),
+                    },
+                )
+
+        # 元の戦略順で結果を並べる（合計 pips の加算順も元のまま）
+        per_pair = {}
+        for row_pos, (pair, record) in enumerate(rows):
+            if row_pos in pnl_by_row:
+                total_pips += pnl_by_row[row_pos]
+            per_pair.setdefault(pair, []).append(record)
 
         entry_fill_rate = filled_count / num_strats if num_strats > 0 else None
         win_rate_tp = win_tp_count / filled_count if filled_count > 0 else None
@@ -1,69 +1,67 @@
 """
 Core module for FX-Kline
 Provides data fetching, validation, and timezone handling
-"""
-
-from .models import (
-    OHLCRequest,
-    BatchOHLCRequest,
-    FetchError,
-    OHLCData,
-    BatchOHLCResponse,
-)
-
-from .validators import (
-    validate_currency_pair,
-    validate_timeframe,
-    validate_period,
-    validate_business_days,
-    get_supported_pairs,
-    get_supported_timeframes,
-    get_preset_pairs,
-    get_preset_timeframes,
-    get_default_business_days_for_timeframe,
-    SUPPORTED_CURRENCY_PAIRS,
-    SUPPORTED_TIMEFRAMES,
-    DEFAULT_TIMEFRAME_BUSINESS_DAYS,
-    FALLBACK_TIMEFRAME_BUSINESS_DAYS,
-    ValidationError,
-)
-
-from .data_fetcher import (
-    fetch_single_ohlc,
-    fetch_single_ohlc_async,
-    fetch_batch_ohlc,
-    fetch_batch_ohlc_sync,
-    export_to_csv,
-    export_to_json,
-    export_to_csv_string,
-    get_batch_csv_export,
-    get_batch_json_export,
-)
 
-from .business_days import (
-    filter_business_days,
-    is_business_day,
-    get_business_days_back,
-    get_business_day_range,
-    count_business_days,
-    validate_data_coverage,
-    get_latest_business_day,
-    get_data_date_range,
-)
+Public names are imported lazily on first access, so running a single
+submodule (e.g. ``python -m fx_kline.core.l3_evaluator``) does not load
+pandas, pydantic and the fetcher stack up front.
+"""
 
-from .timezone_utils import (
-    utc_to_jst,
-    convert_dataframe_to_jst,
-    get_us_market_hours_in_jst,
-    is_us_dst_active,
-    format_timestamp_jst,
-    get_jst_now,
-    get_business_day_offset_jst,
-)
+from importlib import import_module
 
-from .summary_consolidator import (
-    consolidate_reports_batch,
-)
+# Public name -> submodule that defines it
+_EXPORTS = {
+    # Models
+    "OHLCRequest": "models",
+    "BatchOHLCRequest": "models",
+    "FetchError": "models",
+    "OHLCData": "models",
+    "BatchOHLCResponse": "models",
+    # Validators
+    "validate_currency_pair": "validators",
+    "validate_timeframe": "validators",
+    "validate_period": "validators",
+    "validate_business_days": "validators",
+    "get_supported_pairs": "validators",
+    "get_supported_timeframes": "validators",
+    "get_preset_pairs": "validators",
+    "get_preset_timeframes": "validators",
+    "get_default_business_days_for_timeframe": "validators",
+    "SUPPORTED_CURRENCY_PAIRS": "validators",
+    "SUPPORTED_TIMEFRAMES": "validators",
+    "DEFAULT_TIMEFRAME_BUSINESS_DAYS": "validators",
+    "FALLBACK_TIMEFRAME_BUSINESS_DAYS": "validators",
+    "ValidationError": "validators",
+    # Data fetcher
+    "fetch_single_ohlc": "data_fetcher",
+    "fetch_single_ohlc_async": "data_fetcher",
+    "fetch_batch_ohlc": "data_fetcher",
+    "fetch_batch_ohlc_sync": "data_fetcher",
+    "export_to_csv": "data_fetcher",
+    "export_to_json": "data_fetcher",
+    "export_to_csv_string": "data_fetcher",
+    "get_batch_csv_export": "data_fetcher",
+    "get_batch_json_export": "data_fetcher",
+    # Business days
+    "filter_business_days": "business_days",
+    "is_business_day": "business_days",
+    "get_business_days_back": "business_days",
+    "get_business_day_range": "business_days",
+    "count_business_days": "business_days",
+    "validate_data_coverage": "business_days",
+    "get_latest_business_day": "business_days",
+    "get_data_date_range": "business_days",
+    # Timezone utils
+    "utc_to_jst": "timezone_utils",
+    "convert_dataframe_to_jst": "timezone_utils",
+    "get_us_market_hours_in_jst": "timezone_utils",
+    "is_us_dst_active": "timezone_utils",
+    "format_timestamp_jst": "timezone_utils",
+    "get_jst_now": "timezone_utils",
+    "get_business_day_offset_jst": "timezone_utils",
+    # Summary consolidator
+    "consolidate_reports_batch": "summary_consolidator",
+}
 
 __all__ = [
     # Models
@@ -117,3 +115,16 @@ __all__ = [
     # Summary consolidator
     "consolidate_reports_batch",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -6,11 +6,11 @@ Handles filtering weekends and calculating past N business days
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Tuple, Optional
-import pytz
+from zoneinfo import ZoneInfo
 
-JST_TZ = pytz.timezone('Asia/Tokyo')
-US_EASTERN_TZ = pytz.timezone('US/Eastern')
-EUROPE_TZ = pytz.timezone('Europe/London')
+JST_TZ = ZoneInfo('Asia/Tokyo')
+US_EASTERN_TZ = ZoneInfo('US/Eastern')
+EUROPE_TZ = ZoneInfo('Europe/London')
 
 
 def is_combined_dst_active(dt: Optional[datetime] = None) -> bool:
@@ -33,7 +33,7 @@ def is_combined_dst_active(dt: Optional[datetime] = None) -> bool:
     else:
         # Ensure dt is timezone-aware
         if dt.tzinfo is None:
-            dt = JST_TZ.localize(dt)
+            dt = dt.replace(tzinfo=JST_TZ)
 
     # Check both US and Europe DST status
     us_dt = dt.astimezone(US_EASTERN_TZ)
@@ -194,7 +194,7 @@ def get_business_days_back(days: int, as_of_date: Optional[datetime] = None) ->
     if as_of_date is None:
         as_of_date = datetime.now(JST_TZ).replace(hour=0, minute=0, second=0, microsecond=0)
     elif as_of_date.tzinfo is None:
-        as_of_date = JST_TZ.localize(as_of_date.replace(hour=0, minute=0, second=0, microsecond=0))
+        as_of_date = as_of_date.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=JST_TZ)
 
     # Use pandas BDay for accurate business day calculation
     bday_offset = pd.tseries.offsets.BDay(days)
@@ -217,7 +217,7 @@ def get_business_day_range(days: int, as_of_date: Optional[datetime] = None) ->
     if as_of_date is None:
         end_date = datetime.now(JST_TZ).replace(hour=0, minute=0, second=0, microsecond=0)
     elif as_of_date.tzinfo is None:
-        end_date = JST_TZ.localize(as_of_date.replace(hour=0, minute=0, second=0, microsecond=0))
+        end_date = as_of_date.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=JST_TZ)
     else:
         end_date = as_of_date.astimezone(JST_TZ).replace(hour=0, minute=0, second=0, microsecond=0)
 
@@ -4,15 +4,24 @@ Supports parallel fetching with business day filtering and JST timezone conversi
 """
 
 import asyncio
+import csv
+import hashlib
+import io
 import logging
+import os
 import re
+import time
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from types import ModuleType
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
-import yfinance as yf
 
+from . import json_utils
 from .business_days import filter_business_days_fx, get_business_days_back
 from .models import BatchOHLCResponse, FetchError, OHLCData, OHLCRequest
 from .validators import validate_currency_pair, validate_period, validate_timeframe
@@ -26,13 +35,47 @@ logger = logging.getLogger(__name__)
 # See: https://github.com/ranaroussi/yfinance/issues (known issue)
 _executor = ThreadPoolExecutor(max_workers=1)
 
+# HTTP connections: yfinance keeps one process-wide curl_cffi session (YfData singleton),
+# so keep-alive/TLS reuse across pairs is already in place. Do not pass session= here:
+# yfinance rejects caching sessions, and a plain requests.Session loses the browser
+# impersonation Yahoo needs.
+
+
+def _default_cache_dir() -> Path:
+    """Per-user cache directory ($XDG_CACHE_HOME/fx_kline, else ~/.cache/fx_kline)."""
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache) if xdg_cache and os.path.isabs(xdg_cache) else Path.home() / ".cache"
+    return base / "fx_kline"
+
+
+# On-disk cache for period-based downloads (keyed by pair/interval/period/JST date).
+# Lives in a private per-user directory, never the shared temp dir.
+_CACHE_DIR = _default_cache_dir()
+_INTRADAY_CACHE_TTL_SECONDS = 5 * 60
+_DAILY_CACHE_TTL_SECONDS = 60 * 60
+
 _PERIOD_PATTERN = re.compile(r"^(\d+)([a-z]+)$")
 _INTERVAL_PATTERN = re.compile(r"^(\d+)([a-z]+)$")
 
 
+@lru_cache(maxsize=1)
+def _yf() -> ModuleType:
+    """Import yfinance on first use (it pulls in a large HTTP/parsing stack at import time)."""
+    import yfinance
+
+    return yfinance
+
+
+def __getattr__(name: str):
+    # Keep ``data_fetcher.yf`` available without importing yfinance at module load
+    if name == "yf":
+        return _yf()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def _download_with_period(pair: str, interval: str, period: str) -> pd.DataFrame:
     """Fetch data from yfinance using period-based window."""
-    return yf.download(
+    return _yf().download(
         pair,
         interval=interval,
         period=period,
@@ -41,6 +84,111 @@ def _download_with_period(pair: str, interval: str, period: str) -> pd.DataFrame
     )
 
 
+def _cache_ttl_seconds(interval: str) -> int:
+    """Return how long a cached download stays fresh for the given interval."""
+    _, unit = _parse_interval(interval)
+    if unit in ("m", "h"):
+        return _INTRADAY_CACHE_TTL_SECONDS
+    return _DAILY_CACHE_TTL_SECONDS
+
+
+def _is_owned_by_current_user(st: os.stat_result) -> bool:
+    """True when the stat result belongs to the current user (always True without uids)."""
+    getuid = getattr(os, "getuid", None)
+    return getuid is None or st.st_uid == getuid()
+
+
+def _prepare_cache_dir() -> bool:
+    """
+    Create the cache directory (mode 0o700) and check it is private to the current user
+
+    Returns:
+        True when the directory can be trusted for reading and writing entries
+    """
+    try:
+        _CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = _CACHE_DIR.stat()
+    except OSError as e:
+        logger.debug(f"Cache directory {_CACHE_DIR} unavailable: {e}")
+        return False
+    # Refuse a directory someone else created or that others can write into
+    if not _is_owned_by_current_user(st) or st.st_mode & 0o022:
+        logger.warning(f"Ignoring cache directory {_CACHE_DIR}: not private to the current user")
+        return False
+    return True
+
+
+def _prune_cache_dir() -> None:
+    """Delete our cache entries (and leftover temp files) older than the daily TTL."""
+    cutoff = time.time() - _DAILY_CACHE_TTL_SECONDS
+    for pattern in ("*.parquet", "*.tmp"):
+        for path in _CACHE_DIR.glob(pattern):
+            try:
+                st = path.stat()
+                if _is_owned_by_current_user(st) and st.st_mtime < cutoff:
+                    path.unlink()
+            except OSError as e:
+                logger.debug(f"Could not prune cache entry {path}: {e}")
+
+
+def _download_with_period_cached(
+    pair: str,
+    interval: str,
+    period: str,
+    force_refresh: bool = False
+) -> pd.DataFrame:
+    """Period-based download backed by a short-lived on-disk Parquet cache."""
+    if not _prepare_cache_dir():
+        return _download_with_period(pair, interval, period)
+
+    key = f"{pair}|{interval}|{period}|{get_jst_now().date().isoformat()}"
+    cache_path = _CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()}.parquet"
+
+    if not force_refresh:
+        try:
+            st = cache_path.stat()
+            if (
+                _is_owned_by_current_user(st)
+                and time.time() - st.st_mtime < _cache_ttl_seconds(interval)
+            ):
+                return pd.read_parquet(cache_path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable cache entry {cache_path}: {e}")
+
+    df = _download_with_period(pair, interval, period)
+
+    # Only cache real data; an empty frame is usually a transient API failure
+    if not df.empty:
+        _prune_cache_dir()
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            df.to_parquet(tmp_path)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            logger.debug(f"Could not write cache entry {cache_path}: {e}")
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    return df
+
+
+def _download_batch(symbols: List[str], interval: str, period: str) -> pd.DataFrame:
+    """Fetch several tickers with one period-based yfinance request (grouped by ticker)."""
+    return _yf().download(
+        symbols,
+        interval=interval,
+        period=period,
+        group_by="ticker",
+        threads=False,
+        auto_adjust=False,
+        progress=False
+    )
+
+
 def _download_with_fallback_window(pair: str, interval: str, business_days: int) -> pd.DataFrame:
     """Fetch data using an explicit date window when period-based fetch under-delivers."""
     end_jst = get_jst_now()
@@ -52,7 +200,7 @@ def _download_with_fallback_window(pair: str, interval: str, business_days: int)
     start_utc = start_jst.astimezone(timezone.utc)
     end_utc = end_jst.astimezone(timezone.utc)
 
-    return yf.download(
+    return _yf().download(
         pair,
         interval=interval,
         start=start_utc,
@@ -67,17 +215,20 @@ def _prepare_dataframe(df: pd.DataFrame, interval: str, symbol: str, exclude_wee
     if df.empty:
         return df
 
-    processed = df.copy()
+    processed = df
 
     # Flatten multi-index columns first (before timezone conversion)
+    # A shallow copy is enough: only the column labels are replaced, not the data
     if isinstance(processed.columns, pd.MultiIndex):
+        processed = processed.copy(deep=False)
         processed.columns = processed.columns.get_level_values(0)
 
     if processed.empty:
         return processed
 
-    # Convert to JST timezone
-    processed = convert_dataframe_to_jst(processed)
+    # Convert to JST timezone (skipped when the frame is already JST-indexed)
+    if str(getattr(processed.index, "tz", None)) != "Asia/Tokyo":
+        processed = convert_dataframe_to_jst(processed)
 
     if processed.empty:
         return processed
@@ -86,9 +237,22 @@ def _prepare_dataframe(df: pd.DataFrame, interval: str, symbol: str, exclude_wee
     if exclude_weekends:
         processed = filter_business_days_fx(processed, interval, symbol)
 
+    # OHLC columns are left as float64 on purpose: exported values are written with repr(),
+    # which a float32 round-trip would change (155.123 -> 155.12300109863281)
     return processed
 
 
+def _count_raw_jst_days(df: pd.DataFrame) -> Optional[int]:
+    """Upper bound on JST days a raw download can yield (filtering only removes rows)."""
+    if df.empty:
+        return 0
+    if not isinstance(df.index, pd.DatetimeIndex):
+        return None
+
+    index = df.index if df.index.tz is not None else df.index.tz_localize(timezone.utc)
+    return index.tz_convert(JST_TZ).normalize().nunique()
+
+
 def _extract_business_days(period: str) -> Optional[int]:
     """Extract desired business-day lookback from a period string like '5d'."""
     match = _PERIOD_PATTERN.match(period)
@@ -159,14 +323,14 @@ def fetch_ohlc_range_dataframe(
 
     # Handle naive datetimes by assuming they are JST (project standard)
     if start.tzinfo is None:
-        start = JST_TZ.localize(start)
+        start = start.replace(tzinfo=JST_TZ)
     if end.tzinfo is None:
-        end = JST_TZ.localize(end)
+        end = end.replace(tzinfo=JST_TZ)
 
     start_utc = start.astimezone(timezone.utc)
     end_utc = end.astimezone(timezone.utc)
 
-    df = yf.download(
+    df = _yf().download(
         pair_formatted,
         interval=interval_validated,
         start=start_utc,
@@ -181,11 +345,83 @@ def fetch_ohlc_range_dataframe(
     return _prepare_dataframe(df, interval_validated, pair_formatted, exclude_weekends)
 
 
+def _slice_ticker_frame(df: pd.DataFrame, symbol: str) -> pd.DataFrame:
+    """Extract one ticker's OHLC columns from a group_by='ticker' download."""
+    if isinstance(df.columns, pd.MultiIndex):
+        if symbol not in df.columns.get_level_values(0):
+            return pd.DataFrame()
+        df = df[symbol]
+
+    # Multi-ticker downloads share a union index; drop rows this ticker never traded
+    return df.dropna(how="all")
+
+
+def fetch_ohlc_range_multi(
+    pairs: List[str],
+    interval: str,
+    start: datetime,
+    end: datetime,
+    exclude_weekends: bool = True,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Fetch OHLC data for several pairs over the same window with a single yfinance request.
+
+    Args:
+        pairs: Currency pair codes (e.g., ['USDJPY', 'EURUSD'])
+        interval: Timeframe (e.g., '1h', '15m', '1d')
+        start: Start datetime (timezone-aware preferred, naive datetimes assumed to be JST)
+        end: End datetime (timezone-aware preferred, naive datetimes assumed to be JST)
+        exclude_weekends: Filter out weekend data
+
+    Returns:
+        Dictionary with pair as key and JST-indexed DataFrame as value.
+        Pairs for which yfinance returned no rows are omitted.
+    """
+    symbols = {pair: validate_currency_pair(pair) for pair in pairs}
+    interval_validated = validate_timeframe(interval)
+
+    # Handle naive datetimes by assuming they are JST (project standard)
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=JST_TZ)
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=JST_TZ)
+
+    start_utc = start.astimezone(timezone.utc)
+    end_utc = end.astimezone(timezone.utc)
+
+    frames: Dict[str, pd.DataFrame] = {}
+    if not symbols:
+        return frames
+
+    df = _yf().download(
+        list(dict.fromkeys(symbols.values())),
+        interval=interval_validated,
+        start=start_utc,
+        end=end_utc,
+        group_by="ticker",
+        threads=True,
+        auto_adjust=False,
+        progress=False,
+    )
+
+    if df.empty:
+        return frames
+
+    for pair, symbol in symbols.items():
+        df_pair = _slice_ticker_frame(df, symbol)
+        if df_pair.empty:
+            continue
+        frames[pair] = _prepare_dataframe(df_pair, interval_validated, symbol, exclude_weekends)
+
+    return frames
+
+
 def fetch_single_ohlc(
     pair: str,
     interval: str,
     period: str,
-    exclude_weekends: bool = True
+    exclude_weekends: bool = True,
+    force_refresh: bool = False
 ) -> Tuple[Optional[OHLCData], Optional[FetchError]]:
     """
     Fetch OHLC data for a single currency pair (synchronous)
@@ -195,11 +431,37 @@ def fetch_single_ohlc(
         interval: Timeframe (e.g., '1h', '1d')
         period: Period (e.g., '30d')
         exclude_weekends: Filter out weekend data
+        force_refresh: Bypass the on-disk download cache
 
     Returns:
         Tuple of (OHLCData or None, FetchError or None)
         One will be populated, the other None
     """
+    return _fetch_single_ohlc(pair, interval, period, exclude_weekends, force_refresh=force_refresh)
+
+
+def _fetch_single_ohlc(
+    pair: str,
+    interval: str,
+    period: str,
+    exclude_weekends: bool,
+    prefetched: Optional[pd.DataFrame] = None,
+    force_refresh: bool = False
+) -> Tuple[Optional[OHLCData], Optional[FetchError]]:
+    """
+    Build the OHLC result for one pair, downloading only if no data was prefetched
+
+    Args:
+        pair: Currency pair code (e.g., 'USDJPY')
+        interval: Timeframe (e.g., '1h', '1d')
+        period: Period (e.g., '30d')
+        exclude_weekends: Filter out weekend data
+        prefetched: Raw yfinance frame for this pair from a batched download
+        force_refresh: Bypass the on-disk download cache
+
+    Returns:
+        Tuple of (OHLCData or None, FetchError or None)
+    """
     try:
         # Validate inputs
         pair_formatted = validate_currency_pair(pair)
@@ -211,25 +473,38 @@ def fetch_single_ohlc(
         is_minute_interval = interval_unit == "m"
 
         # Fetch data from yfinance
-        df = _download_with_period(pair_formatted, interval_validated, period_validated)
+        if prefetched is not None:
+            df = prefetched
+        else:
+            df = _download_with_period_cached(
+                pair_formatted, interval_validated, period_validated, force_refresh=force_refresh
+            )
         raw_data_present = not df.empty
 
         df_jst = _prepare_dataframe(df, interval_validated, pair_formatted, exclude_weekends)
 
         # Attempt fallback if coverage is clearly insufficient
-        if (
-            not is_minute_interval
-            and expected_business_days is not None
-            and _count_unique_business_days(df_jst) < expected_business_days
-        ):
+        # (count the primary frame's days once; it is needed for both checks below)
+        primary_days = (
+            _count_unique_business_days(df_jst)
+            if not is_minute_interval and expected_business_days is not None
+            else None
+        )
+        if primary_days is not None and primary_days < expected_business_days:
             df_fallback = _download_with_fallback_window(pair_formatted, interval_validated, expected_business_days)
             raw_data_present = raw_data_present or not df_fallback.empty
-            df_fallback_jst = _prepare_dataframe(df_fallback, interval_validated, pair_formatted, exclude_weekends)
 
-            if _count_unique_business_days(df_fallback_jst) >= _count_unique_business_days(df_jst):
-                df_jst = df_fallback_jst.copy()
-            elif df_jst.empty and not df_fallback_jst.empty:
-                df_jst = df_fallback_jst.copy()
+            # Only prepare the fallback frame if it can cover at least as many days
+            fallback_day_bound = _count_raw_jst_days(df_fallback)
+            if fallback_day_bound is None or fallback_day_bound >= primary_days:
+                df_fallback_jst = _prepare_dataframe(
+                    df_fallback, interval_validated, pair_formatted, exclude_weekends
+                )
+
+                if _count_unique_business_days(df_fallback_jst) >= primary_days:
+                    df_jst = df_fallback_jst
+                elif df_jst.empty and not df_fallback_jst.empty:
+                    df_jst = df_fallback_jst
 
         # Handle empty data
         if df_jst.empty:
@@ -248,8 +523,9 @@ def fetch_single_ohlc(
             normalized_index = df_jst.index.normalize()
             unique_days = normalized_index.unique()
             if len(unique_days) > expected_business_days:
-                keep_days = set(unique_days[-expected_business_days:])
-                df_jst = df_jst[normalized_index.isin(keep_days)]
+                # unique_days is sorted, so keeping the last N days is a single cutoff comparison
+                cutoff = unique_days[-expected_business_days]
+                df_jst = df_jst[normalized_index >= cutoff]
 
         # Prepare OHLC data
         ohlc_columns = []
@@ -270,26 +546,40 @@ def fetch_single_ohlc(
             )
             return None, error
 
-        df_ohlc = df_jst[ohlc_columns].copy()
+        df_ohlc = df_jst[ohlc_columns]
 
-        # Convert DataFrame to list of dicts
-        rows = []
-        for idx, row in df_ohlc.iterrows():
-            try:
-                row_dict = {
-                    'Datetime': idx.strftime('%Y-%m-%d %H:%M:%S %Z') if hasattr(idx, 'strftime') else str(idx),
-                    'Open': float(row['Open']) if 'Open' in ohlc_columns else 0.0,
-                    'High': float(row['High']) if 'High' in ohlc_columns else 0.0,
-                    'Low': float(row['Low']) if 'Low' in ohlc_columns else 0.0,
-                    'Close': float(row['Close']) if 'Close' in ohlc_columns else 0.0,
-                }
-                if 'Volume' in ohlc_columns:
-                    row_dict['Volume'] = int(row['Volume']) if pd.notna(row['Volume']) else 0
-                rows.append(row_dict)
-            except Exception as e:
-                # Log and skip rows with errors
-                logger.debug(f"Skipping row {idx} due to conversion error: {e}")
-                continue
+        # Convert DataFrame to list of dicts from whole-column arrays (no per-row Series)
+        n_rows = len(df_ohlc)
+        stamps = df_ohlc.index.strftime('%Y-%m-%d %H:%M:%S %Z').tolist()
+        missing = [0.0] * n_rows
+        opens, highs, lows, closes = (
+            df_ohlc[col].to_numpy(dtype=float).tolist() if col in ohlc_columns else missing
+            for col in ('Open', 'High', 'Low', 'Close')
+        )
+
+        if 'Volume' in ohlc_columns:
+            volumes = df_ohlc['Volume'].to_numpy()
+            if volumes.dtype.kind in 'iu':
+                volume_list = volumes.tolist()
+                valid = [True] * n_rows
+            else:
+                volumes = volumes.astype(float)
+                is_nan = np.isnan(volumes)
+                # +/-inf cannot become an int; such rows are skipped
+                valid = (is_nan | np.isfinite(volumes)).tolist()
+                volume_list = np.where(is_nan | ~np.isfinite(volumes), 0, volumes).astype(np.int64).tolist()
+
+            rows = []
+            for ts, o, h, l, c, v, ok in zip(stamps, opens, highs, lows, closes, volume_list, valid):
+                if not ok:
+                    logger.debug(f"Skipping row {ts} due to non-finite volume")
+                    continue
+                rows.append({'Datetime': ts, 'Open': o, 'High': h, 'Low': l, 'Close': c, 'Volume': v})
+        else:
+            rows = [
+                {'Datetime': ts, 'Open': o, 'High': h, 'Low': l, 'Close': c}
+                for ts, o, h, l, c in zip(stamps, opens, highs, lows, closes)
+            ]
 
         if not rows:
             error = FetchError(
@@ -342,7 +632,7 @@ async def fetch_single_ohlc_async(
     Returns:
         Tuple of (OHLCData or None, FetchError or None)
     """
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     return await loop.run_in_executor(
         _executor,
         fetch_single_ohlc,
@@ -353,12 +643,61 @@ async def fetch_single_ohlc_async(
     )
 
 
+def _fetch_ohlc_group(
+    requests: List[OHLCRequest],
+    exclude_weekends: bool
+) -> List[Tuple[Optional[OHLCData], Optional[FetchError]]]:
+    """
+    Fetch requests that share interval and period with one batched download
+
+    Pairs missing from the batched result (or a failed batch) fall back to
+    the per-pair fetch path.
+
+    Args:
+        requests: Requests with identical interval and period
+        exclude_weekends: Filter out weekend data
+
+    Returns:
+        List of (OHLCData or None, FetchError or None) in request order
+    """
+    if len(requests) == 1:
+        req = requests[0]
+        return [fetch_single_ohlc(req.pair, req.interval, req.period, exclude_weekends)]
+
+    try:
+        symbols = {req.pair: validate_currency_pair(req.pair) for req in requests}
+        interval_validated = validate_timeframe(requests[0].interval)
+        period_validated = validate_period(requests[0].period)
+        raw = _download_batch(list(dict.fromkeys(symbols.values())), interval_validated, period_validated)
+    except Exception as e:
+        logger.debug(f"Batched download failed, fetching pairs individually: {e}")
+        return [
+            fetch_single_ohlc(req.pair, req.interval, req.period, exclude_weekends)
+            for req in requests
+        ]
+
+    results = []
+    for req in requests:
+        df_pair = _slice_ticker_frame(raw, symbols[req.pair])
+        if df_pair.empty:
+            results.append(fetch_single_ohlc(req.pair, req.interval, req.period, exclude_weekends))
+        else:
+            results.append(
+                _fetch_single_ohlc(req.pair, req.interval, req.period, exclude_weekends, prefetched=df_pair)
+            )
+    return results
+
+
 async def fetch_batch_ohlc(
     requests: List[OHLCRequest],
     exclude_weekends: bool = True
 ) -> BatchOHLCResponse:
     """
-    Fetch OHLC data for multiple currency pairs in parallel
+    Fetch OHLC data for multiple currency pairs
+
+    Requests sharing the same interval and period are fetched with a single
+    multi-ticker yfinance download. Duplicate requests (same pair, interval
+    and period) are fetched once and share the result.
 
     Args:
         requests: List of OHLCRequest objects
@@ -367,14 +706,36 @@ async def fetch_batch_ohlc(
     Returns:
         BatchOHLCResponse with successful and failed requests
     """
-    # Create async tasks
+    # Map each request to the first identical one so duplicates are fetched once
+    first_position: Dict[Tuple[str, str, str], int] = {}
+    canonical = [
+        first_position.setdefault((req.pair, req.interval, req.period), position)
+        for position, req in enumerate(requests)
+    ]
+
+    # Group unique request positions by (interval, period) so each group is one download
+    groups: Dict[Tuple[str, str], List[int]] = {}
+    for position in first_position.values():
+        req = requests[position]
+        groups.setdefault((req.interval, req.period), []).append(position)
+
+    loop = asyncio.get_running_loop()
     tasks = [
-        fetch_single_ohlc_async(req.pair, req.interval, req.period, exclude_weekends)
-        for req in requests
+        loop.run_in_executor(
+            _executor,
+            _fetch_ohlc_group,
+            [requests[position] for position in positions],
+            exclude_weekends
+        )
+        for positions in groups.values()
     ]
+    group_results = await asyncio.gather(*tasks, return_exceptions=False)
 
-    # Execute all tasks in parallel
-    results = await asyncio.gather(*tasks, return_exceptions=False)
+    # Restore the original request order, fanning results out to duplicates
+    unique_results: Dict[int, Tuple[Optional[OHLCData], Optional[FetchError]]] = {}
+    for positions, group_result in zip(groups.values(), group_results):
+        unique_results.update(zip(positions, group_result))
+    results = [unique_results[position] for position in canonical]
 
     # Separate successes and failures
     successful = []
@@ -413,12 +774,7 @@ def fetch_batch_ohlc_sync(
     Returns:
         BatchOHLCResponse with successful and failed requests
     """
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(fetch_batch_ohlc(requests, exclude_weekends))
-    finally:
-        loop.close()
+    return asyncio.run(fetch_batch_ohlc(requests, exclude_weekends))
 
 
 def export_to_csv(ohlc_data: OHLCData) -> str:
@@ -431,26 +787,35 @@ def export_to_csv(ohlc_data: OHLCData) -> str:
     Returns:
         CSV string
     """
-    # Create DataFrame from rows
-    df = pd.DataFrame(ohlc_data.rows)
-
-    # Convert to CSV
-    csv_string = df.to_csv(index=False)
-    return csv_string
+    rows = ohlc_data.rows
+    if not rows:
+        return os.linesep
+
+    # Write rows straight from the dicts (same text as DataFrame.to_csv, minus the frame build)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator=os.linesep)
+    writer.writerow(rows[0].keys())
+    writer.writerows(
+        ["" if isinstance(v, float) and v != v else v for v in row.values()]
+        for row in rows
+    )
+    return buffer.getvalue()
 
 
 def export_to_json(ohlc_data: OHLCData) -> str:
     """
     Export OHLC data to JSON format
 
+    The document parses to the same value as json.dumps output, but with
+    orjson installed floats below 1e-4 are written positionally (``1e-05``
+    becomes ``0.00001``), so the text is not always byte-identical
+
     Args:
         ohlc_data: OHLCData object
 
     Returns:
         JSON string
     """
-    import json
-
     # Convert to dict and then to JSON
     data_dict = {
         "pair": ohlc_data.pair,
@@ -460,7 +825,7 @@ def export_to_json(ohlc_data: OHLCData) -> str:
         "rows": ohlc_data.rows
     }
 
-    return json.dumps(data_dict, indent=2, ensure_ascii=False)
+    return json_utils.dumps(data_dict, indent=2, ensure_ascii=False)
 
 
 def export_to_csv_string(ohlc_data: OHLCData, include_header: bool = True) -> str:
@@ -474,19 +839,18 @@ def export_to_csv_string(ohlc_data: OHLCData, include_header: bool = True) -> st
     Returns:
         Comma-separated string
     """
-    lines = []
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
 
     if include_header and ohlc_data.rows:
         # Get column names from first row
-        header = ",".join(ohlc_data.rows[0].keys())
-        lines.append(header)
+        writer.writerow(ohlc_data.rows[0].keys())
 
     # Add data rows
-    for row in ohlc_data.rows:
-        values = [str(v) for v in row.values()]
-        lines.append(",".join(values))
+    writer.writerows(row.values() for row in ohlc_data.rows)
 
-    return "\n".join(lines)
+    # Clipboard text has no trailing newline
+    return buffer.getvalue()[:-1]
 
 
 def get_batch_csv_export(response: BatchOHLCResponse) -> Dict[str, str]:
@@ -511,14 +875,15 @@ def get_batch_json_export(response: BatchOHLCResponse) -> str:
     """
     Export all successful batch results to JSON
 
+    Same encoding as export_to_json: value-equal to json.dumps output, but
+    floats below 1e-4 may be written positionally when orjson is installed
+
     Args:
         response: BatchOHLCResponse object
 
     Returns:
         JSON string with all results
     """
-    import json
-
     data = {
         "summary": response.summary,
         "successful": [
@@ -543,4 +908,4 @@ def get_batch_json_export(response: BatchOHLCResponse) -> str:
         ]
     }
 
-    return json.dumps(data, indent=2, ensure_ascii=False)
+    return json_utils.dumps(data, indent=2, ensure_ascii=False)
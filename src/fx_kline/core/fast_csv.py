@@ -0,0 +1,55 @@
+"""
+Fast CSV writer for numeric OHLC frames
+Produces the same text as DataFrame.to_csv(index=True) without pandas' generic CSV machinery
+"""
+
+from pathlib import Path
+from typing import List, Union
+
+import numpy as np
+import pandas as pd
+
+
+# Large buffer so the whole file goes out in a single write
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _format_column(values: np.ndarray) -> List[str]:
+    """
+    Stringify one column the way pandas' CSV writer does
+
+    Args:
+        values: 1-D column values
+
+    Returns:
+        List of cell strings (floats use repr, NaN becomes an empty cell)
+    """
+    if values.dtype.kind == "f":
+        return ["" if v != v else repr(v) for v in values.tolist()]
+    return [str(v) for v in values.tolist()]
+
+
+def write_ohlc_csv(df: pd.DataFrame, path: Union[str, Path]) -> None:
+    """
+    Write a numeric OHLC DataFrame (with DatetimeIndex) to CSV
+
+    Output is byte-identical to ``df.to_csv(path, index=True)`` for frames
+    whose columns are all numeric.
+
+    Args:
+        df: DataFrame with a DatetimeIndex and numeric columns
+        path: Destination file path
+    """
+    index_name = df.index.name if df.index.name is not None else ""
+    header = ",".join([str(index_name), *map(str, df.columns)])
+
+    # DatetimeIndex.astype(str) matches pandas' CSV date format (e.g. 2025-11-27 00:00:00+09:00)
+    columns = [df.index.astype(str).tolist()]
+    columns.extend(_format_column(df[col].to_numpy()) for col in df.columns)
+
+    lines = [header]
+    lines.extend(",".join(row) for row in zip(*columns))
+    lines.append("")
+
+    with open(path, "w", buffering=_WRITE_BUFFER_SIZE, newline="") as fh:
+        fh.write("\n".join(lines))
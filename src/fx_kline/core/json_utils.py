@@ -0,0 +1,147 @@
+"""
+JSON helpers for FX-Kline
+Uses orjson when it is installed and falls back to the standard library otherwise
+"""
+
+import functools
+import json
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speed-up
+    orjson = None
+
+
+PathLike = Union[str, Path]
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Deserialize a JSON document
+
+    Args:
+        data: JSON text as bytes or str
+
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity tokens the standard library writes
+            pass
+    return json.loads(data)
+
+
+def load_json_file(path: PathLike) -> Any:
+    """
+    Read and parse a JSON file in one shot
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed Python object
+    """
+    return loads(Path(path).read_bytes())
+
+
+def _stdlib_default(default: Callable[[Any], Any], obj: Any) -> Any:
+    """Write float subclasses as numbers like json does before calling ``default``"""
+    if isinstance(obj, float):
+        return float(obj)
+    return default(obj)
+
+
+def dumps_bytes(
+    obj: Any,
+    indent: Optional[int] = 2,
+    default: Optional[Callable[[Any], Any]] = None,
+    ensure_ascii: bool = False,
+) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON
+
+    orjson is used for ``indent`` of 2 or None (the layouts it supports);
+    any other indent goes through the standard library. The orjson result
+    parses to the same value the standard library would write, but is not
+    always byte-identical: floats below 1e-4 are written in positional form
+    (``1e-05`` becomes ``0.00001``). To keep the values equal:
+
+    - orjson writes NaN/Infinity as ``null``, so any output containing
+      ``null`` is re-serialized with the standard library (which keeps
+      ``NaN``/``Infinity`` and writes ``None`` as ``null`` itself)
+    - orjson always emits UTF-8, so with ``ensure_ascii=True`` non-ASCII
+      output is re-serialized with escapes
+    - with a ``default``, numpy scalars, datetimes and dataclasses are handed
+      to it exactly as the standard library would (float subclasses such as
+      ``numpy.float64`` are still written as numbers); Enum members are the
+      one exception and are written by value
+
+    Args:
+        obj: Object to serialize
+        indent: Indentation width (2 or None for the fast path)
+        default: Fallback serializer for unsupported types
+        ensure_ascii: Escape non-ASCII characters
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None and indent in (2, None):
+        option = orjson.OPT_NON_STR_KEYS
+        orjson_default = default
+        if default is None:
+            option |= orjson.OPT_SERIALIZE_NUMPY
+        else:
+            option |= orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+            orjson_default = functools.partial(_stdlib_default, default)
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        encoded = orjson.dumps(obj, default=orjson_default, option=option)
+        if b"null" not in encoded and not (ensure_ascii and not encoded.isascii()):
+            return encoded
+    return json.dumps(obj, indent=indent, default=default, ensure_ascii=ensure_ascii).encode("utf-8")
+
+
+def dumps(
+    obj: Any,
+    indent: Optional[int] = 2,
+    default: Optional[Callable[[Any], Any]] = None,
+    ensure_ascii: bool = False,
+) -> str:
+    """
+    Serialize an object to a JSON string
+
+    Args:
+        obj: Object to serialize
+        indent: Indentation width
+        default: Fallback serializer for unsupported types
+        ensure_ascii: Escape non-ASCII characters
+
+    Returns:
+        JSON document as str
+    """
+    return dumps_bytes(obj, indent=indent, default=default, ensure_ascii=ensure_ascii).decode("utf-8")
+
+
+def dump_json_file(
+    obj: Any,
+    path: PathLike,
+    indent: Optional[int] = 2,
+    default: Optional[Callable[[Any], Any]] = None,
+    ensure_ascii: bool = False,
+) -> None:
+    """
+    Serialize an object and write it to a file with a single write call
+
+    Args:
+        obj: Object to serialize
+        path: Destination file path
+        indent: Indentation width
+        default: Fallback serializer for unsupported types
+        ensure_ascii: Escape non-ASCII characters
+    """
+    Path(path).write_bytes(dumps_bytes(obj, indent=indent, default=default, ensure_ascii=ensure_ascii))
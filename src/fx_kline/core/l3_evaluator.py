@@ -17,26 +17,90 @@ Usage:
         --prediction data/2025-11-27/L4_tradeplan.json \\
         --actual data/2025-11-28/ohlc_summary.json \\
         --output data/2025-11-27/L4_hitl_evaluation.json
+
+    # Evaluate every dated directory under data/ in parallel
+    python -m fx_kline.core.l3_evaluator --mode ai --batch-dir data \\
+        --output data/L4_ai_aggregate.json
 """
 
 from __future__ import annotations
 
 import argparse
-import json
 import logging
-from dataclasses import asdict, dataclass, field
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields, is_dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-import pandas as pd
+import numpy as np
 
+from . import json_utils
 from .timezone_utils import get_jst_now
+from .validators import SUPPORTED_CURRENCY_PAIRS
 
 logger = logging.getLogger(__name__)
 
+# Price change of one pip per pair (0.01 for JPY crosses, 0.0001 otherwise)
+_PIP_VALUE: Dict[str, float] = {
+    pair: 0.01 if pair.endswith("JPY") else 0.0001 for pair in SUPPORTED_CURRENCY_PAIRS
+}
+
+
+# Integer direction codes, resolved once per prediction instead of string
+# comparisons in every metric helper. Anything else (e.g. a typo) maps to
+# _DIR_OTHER, which scores like SHORT for timing/pips and is never "correct".
+_DIR_WAIT = 0
+_DIR_LONG = 1
+_DIR_SHORT = -1
+_DIR_OTHER = 2
+_DIR_CODE: Dict[str, int] = {"WAIT": _DIR_WAIT, "LONG": _DIR_LONG, "SHORT": _DIR_SHORT}
+
+
+# HITL modification keywords, matched in one case-insensitive scan per modification.
+# Keyword priority within a single modification_type: risk > aggressive > cancellation/wait
+_INTERVENTION_RE = re.compile(r"(?P<risk>risk)|(?P<agg>aggressive)|(?P<cxl>cancellation|wait)", re.I)
+_INTERVENTION_TYPES = (
+    ("risk", "risk_reduction"),
+    ("agg", "aggressive_adjustment"),
+    ("cxl", "trade_cancellation"),
+)
+
+
+def _pip_value(pair: str) -> float:
+    """Pip size for a pair, falling back on the JPY suffix for unlisted pairs"""
+    pip = _PIP_VALUE.get(pair)
+    if pip is None:
+        pip = 0.01 if pair.endswith("JPY") else 0.0001
+    return pip
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    # Fields marked with metadata {"serialize": False} are internal and stay out of to_dict()
+    return tuple(f.name for f in fields(cls) if f.metadata.get("serialize", True))
+
 
-@dataclass
+def _to_builtins(value: Any) -> Any:
+    """Convert nested dataclasses/containers to plain dicts and lists
+
+    Equivalent to ``dataclasses.asdict`` for JSON-style data, but walks each
+    object once instead of deep-copying every leaf value.
+    """
+    if is_dataclass(value) and not isinstance(value, type):
+        return {name: _to_builtins(getattr(value, name)) for name in _field_names(type(value))}
+    if isinstance(value, (list, tuple)):
+        return [_to_builtins(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _to_builtins(v) for k, v in value.items()}
+    return value
+
+
+@dataclass(slots=True)
 class PredictionInput:
     """Prediction/Trade plan input (L3 or L4)"""
     direction: str  # "LONG" | "SHORT" | "WAIT"
@@ -52,8 +116,20 @@ class PredictionInput:
     risk_percent: Optional[float] = None
     modifications: Optional[List[dict]] = None  # HITL interventions
 
+    # Derived from ``direction`` / ``pair`` at construction time
+    direction_code: int = field(
+        init=False, repr=False, compare=False, metadata={"serialize": False}
+    )
+    pip_value: float = field(
+        init=False, repr=False, compare=False, metadata={"serialize": False}
+    )
+
+    def __post_init__(self) -> None:
+        self.direction_code = _DIR_CODE.get(self.direction, _DIR_OTHER)
+        self.pip_value = _pip_value(self.pair)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ActualOutcome:
     """Actual market movement"""
     pair: str
@@ -65,7 +141,7 @@ class ActualOutcome:
     volatility: float  # ATR or similar measure
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradeMetrics:
     """Individual trade evaluation metrics"""
     direction_correct: bool
@@ -76,7 +152,7 @@ class TradeMetrics:
     confidence_calibration: Optional[float] = None  # abs(confidence - accuracy)
 
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationResult:
     """Comprehensive evaluation result"""
     # Basic info
@@ -101,11 +177,10 @@ class EvaluationResult:
 
     def to_dict(self) -> dict:
         """Convert to JSON-serializable dict"""
-        result = asdict(self)
-        return result
+        return _to_builtins(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregatedMetrics:
     """Aggregated performance metrics across multiple trades"""
     total_trades: int
@@ -126,7 +201,13 @@ class AggregatedMetrics:
     max_drawdown: Optional[float] = None
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return _to_builtins(self)
+
+
+# PredictionInput fields copied verbatim (same key, None when absent) from
+# the L3 "prediction" / L4 "final_plan" objects
+_L3_PLAN_FIELDS = ("entry_price", "stop_loss", "confidence_score", "reasoning")
+_L4_PLAN_FIELDS = (*_L3_PLAN_FIELDS, "take_profit", "position_size", "risk_percent")
 
 
 def load_prediction(file_path: Path, mode: str) -> PredictionInput:
@@ -139,20 +220,16 @@ def load_prediction(file_path: Path, mode: str) -> PredictionInput:
     Returns:
         PredictionInput object
     """
-    with file_path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = json_utils.load_json_file(file_path)
 
     if mode == "ai":
         # L3_prediction.json structure
         pred = data.get("prediction", {})
         return PredictionInput(
             direction=pred.get("direction", "WAIT").upper(),
-            pair=pred.get("pair", "UNKNOWN"),
-            entry_price=pred.get("entry_price"),
-            stop_loss=pred.get("stop_loss"),
+            pair=sys.intern(pred.get("pair", "UNKNOWN")),
             take_profit=pred.get("target_price") or pred.get("take_profit"),
-            confidence_score=pred.get("confidence_score"),
-            reasoning=pred.get("reasoning")
+            **{name: pred.get(name) for name in _L3_PLAN_FIELDS}
         )
     else:  # mode == "hitl"
         # L4_tradeplan.json structure
@@ -162,61 +239,121 @@ def load_prediction(file_path: Path, mode: str) -> PredictionInput:
 
         return PredictionInput(
             direction=final.get("direction", "WAIT").upper(),
-            pair=base.get("pair", "UNKNOWN"),
-            entry_price=final.get("entry_price"),
-            stop_loss=final.get("stop_loss"),
-            take_profit=final.get("take_profit"),
-            confidence_score=final.get("confidence_score"),
-            reasoning=final.get("reasoning"),
-            position_size=final.get("position_size"),
-            risk_percent=final.get("risk_percent"),
-            modifications=mods
+            pair=sys.intern(base.get("pair", "UNKNOWN")),
+            modifications=mods,
+            **{name: final.get(name) for name in _L4_PLAN_FIELDS}
         )
 
 
-def load_actual_outcome(file_path: Path, pair: str) -> ActualOutcome:
-    """Load actual market outcome from OHLC summary
+@lru_cache(maxsize=64)
+def _load_ohlc_raw(path_str: str, mtime_ns: int) -> Optional[Tuple[float, ...]]:
+    """Parse an OHLC summary file once per (path, mtime)
 
-    Args:
-        file_path: Path to ohlc_summary.json or similar
-        pair: Currency pair to extract
+    Only the 1d bar is kept, so the cache holds five numbers per file rather
+    than the whole parsed summary document. ``mtime_ns`` is part of the cache
+    key so rewritten files are re-read.
 
     Returns:
-        ActualOutcome object
+        (open, high, low, close, atr) of the 1d bar, None if there is none
     """
-    with file_path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = json_utils.load_json_file(path_str)
 
     # Assume ohlc_summary.json has timeframe-specific data
     # Use 1d timeframe for daily evaluation
     timeframes = data.get("timeframes", {})
     daily_data = timeframes.get("1d", {})
-
-    # Extract OHLC from the last bar
-    # This is a simplified example - adjust based on actual data structure
     if not daily_data:
-        raise ValueError(f"No 1d timeframe data found for {pair}")
+        return None
 
     # Placeholder: extract from your actual ohlc_summary structure
-    open_price = daily_data.get("open", 0.0)
-    high_price = daily_data.get("high", 0.0)
-    low_price = daily_data.get("low", 0.0)
-    close_price = daily_data.get("close", 0.0)
-    atr = daily_data.get("atr", 0.0)
-
-    period_return = ((close_price - open_price) / open_price) if open_price > 0 else 0.0
-
-    return ActualOutcome(
-        pair=pair,
-        open_price=open_price,
-        high_price=high_price,
-        low_price=low_price,
-        close_price=close_price,
-        period_return=period_return,
-        volatility=atr
+    return (
+        daily_data.get("open", 0.0),
+        daily_data.get("high", 0.0),
+        daily_data.get("low", 0.0),
+        daily_data.get("close", 0.0),
+        daily_data.get("atr", 0.0),
     )
 
 
+def load_actual_outcomes(file_paths: Dict[str, Path]) -> Dict[str, ActualOutcome]:
+    """Load actual market outcomes for several pairs at once
+
+    Each summary's 1d bar is parsed once (see _load_ohlc_raw) and the period returns
+    for all pairs are computed in one vectorized step.
+
+    Args:
+        file_paths: Mapping of currency pair to its ohlc_summary.json (or similar)
+
+    Returns:
+        Mapping of currency pair to ActualOutcome, in input order
+
+    Raises:
+        ValueError: If a summary has no 1d timeframe data
+    """
+    daily_rows = []
+    for pair, file_path in file_paths.items():
+        resolved = file_path.resolve()
+        daily_bar = _load_ohlc_raw(str(resolved), resolved.stat().st_mtime_ns)
+
+        # Extract OHLC from the last bar
+        # This is a simplified example - adjust based on actual data structure
+        if daily_bar is None:
+            raise ValueError(f"No 1d timeframe data found for {pair}")
+
+        daily_rows.append((sys.intern(pair), *daily_bar))
+
+    if not daily_rows:
+        return {}
+
+    opens = np.array([row[1] for row in daily_rows], dtype=np.float64)
+    closes = np.array([row[4] for row in daily_rows], dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        period_returns = np.where(opens > 0, (closes - opens) / opens, 0.0)
+
+    return {
+        pair: ActualOutcome(
+            pair=pair,
+            open_price=open_price,
+            high_price=high_price,
+            low_price=low_price,
+            close_price=close_price,
+            period_return=float(period_return),
+            volatility=atr
+        )
+        for (pair, open_price, high_price, low_price, close_price, atr), period_return
+        in zip(daily_rows, period_returns)
+    }
+
+
+def load_actual_outcome(file_path: Path, pair: str) -> ActualOutcome:
+    """Load actual market outcome from OHLC summary
+
+    Args:
+        file_path: Path to ohlc_summary.json or similar
+        pair: Currency pair to extract
+
+    Returns:
+        ActualOutcome object
+    """
+    return load_actual_outcomes({pair: file_path})[pair]
+
+
+@lru_cache(maxsize=100_000)
+def _direction_core(code: int, open_price: float, close_price: float, period_return: float) -> bool:
+    if code == _DIR_WAIT:
+        # WAIT is considered correct if price movement was small
+        # (within 0.5% of open)
+        return abs(period_return) < 0.005
+
+    if code == _DIR_LONG:
+        return close_price > open_price
+
+    if code == _DIR_SHORT:
+        return close_price < open_price
+
+    return False
+
+
 def evaluate_direction_accuracy(
     prediction: PredictionInput,
     actual: ActualOutcome
@@ -230,18 +367,9 @@ def evaluate_direction_accuracy(
     Returns:
         True if direction was correct
     """
-    if prediction.direction == "WAIT":
-        # WAIT is considered correct if price movement was small
-        # (within 0.5% of open)
-        return abs(actual.period_return) < 0.005
-
-    if prediction.direction == "LONG":
-        return actual.close_price > actual.open_price
-
-    if prediction.direction == "SHORT":
-        return actual.close_price < actual.open_price
-
-    return False
+    return _direction_core(
+        prediction.direction_code, actual.open_price, actual.close_price, actual.period_return
+    )
 
 
 def calculate_entry_timing_score(
@@ -258,19 +386,22 @@ def calculate_entry_timing_score(
         Score from -1 (too early) to 1 (too late), 0 is ideal
         None if not applicable (WAIT decision or no entry price)
     """
-    if prediction.direction == "WAIT" or prediction.entry_price is None:
+    code = prediction.direction_code
+    entry = prediction.entry_price
+    if code == _DIR_WAIT or entry is None:
         return None
 
-    entry = prediction.entry_price
+    low = actual.low_price
+    high = actual.high_price
 
-    if prediction.direction == "LONG":
+    if code == _DIR_LONG:
         # Best entry would be at the low
-        ideal_entry = actual.low_price
-        worst_entry = actual.high_price
+        ideal_entry = low
+        worst_entry = high
     else:  # SHORT
         # Best entry would be at the high
-        ideal_entry = actual.high_price
-        worst_entry = actual.low_price
+        ideal_entry = high
+        worst_entry = low
 
     # Normalize to -1 to 1
     if worst_entry == ideal_entry:
@@ -283,50 +414,76 @@ def calculate_entry_timing_score(
     return round(score, 3)
 
 
+@lru_cache(maxsize=100_000)
+def _pips_core(
+    code: int,
+    entry: float,
+    stop_loss: Optional[float],
+    take_profit: Optional[float],
+    high: float,
+    low: float,
+    close: float,
+    pip_value: float
+) -> float:
+    # Express both sides as a long (see evaluate_batch): SHORT negates prices,
+    # so "high >= stop" becomes "-high <= -stop". Negation is exact, so the
+    # result is identical to separate LONG/SHORT branches.
+    is_long = code == _DIR_LONG
+    sign = 1.0 if is_long else -1.0
+    adverse = low if is_long else high
+    favourable = high if is_long else low
+
+    # Determine exit price (simplified: use close or stop/target)
+    if stop_loss and sign * adverse <= sign * stop_loss:
+        exit_price = stop_loss
+    elif take_profit and sign * favourable >= sign * take_profit:
+        exit_price = take_profit
+    else:
+        exit_price = close
+
+    # Subtract in trade direction; multiplying by sign turns a flat SHORT into -0.0
+    pips = ((exit_price - entry) if is_long else (entry - exit_price)) / pip_value
+
+    return round(pips, 1)
+
+
 def calculate_pips_outcome(
     prediction: PredictionInput,
     actual: ActualOutcome,
-    pip_value: float = 0.01  # For JPY pairs
+    pip_value: Optional[float] = None
 ) -> Optional[float]:
     """Calculate pips outcome if trade was executed
 
+    The numeric core is memoized on its scalar inputs, so re-evaluating the
+    same plan against the same bar is a cache lookup.
+
     Args:
         prediction: Trade plan
         actual: Actual price movement
-        pip_value: Pip value for the pair (0.01 for JPY, 0.0001 for others)
+        pip_value: Pip value for the pair (defaults to the pair's entry in
+            the pip table: 0.01 for JPY, 0.0001 for others)
 
     Returns:
         Pips gained/lost, None if WAIT
     """
-    if prediction.direction == "WAIT" or prediction.entry_price is None:
-        return None
-
+    code = prediction.direction_code
     entry = prediction.entry_price
+    if code == _DIR_WAIT or entry is None:
+        return None
 
-    # Determine exit price (simplified: use close or stop/target)
-    if prediction.direction == "LONG":
-        # Check if stop loss was hit
-        if prediction.stop_loss and actual.low_price <= prediction.stop_loss:
-            exit_price = prediction.stop_loss
-        # Check if take profit was hit
-        elif prediction.take_profit and actual.high_price >= prediction.take_profit:
-            exit_price = prediction.take_profit
-        else:
-            exit_price = actual.close_price
-
-        pips = (exit_price - entry) / pip_value
-
-    else:  # SHORT
-        if prediction.stop_loss and actual.high_price >= prediction.stop_loss:
-            exit_price = prediction.stop_loss
-        elif prediction.take_profit and actual.low_price <= prediction.take_profit:
-            exit_price = prediction.take_profit
-        else:
-            exit_price = actual.close_price
-
-        pips = (entry - exit_price) / pip_value
-
-    return round(pips, 1)
+    if pip_value is None:
+        pip_value = prediction.pip_value
+
+    return _pips_core(
+        code,
+        entry,
+        prediction.stop_loss,
+        prediction.take_profit,
+        actual.high_price,
+        actual.low_price,
+        actual.close_price,
+        pip_value
+    )
 
 
 def evaluate_single_trade(
@@ -346,69 +503,276 @@ def evaluate_single_trade(
     Returns:
         EvaluationResult with comprehensive metrics
     """
-    # Direction accuracy
-    direction_correct = evaluate_direction_accuracy(prediction, actual)
-
-    # Timing scores
-    entry_timing = calculate_entry_timing_score(prediction, actual)
-
-    # Pips outcome
-    pips = calculate_pips_outcome(prediction, actual)
-
-    # Risk-reward realized
-    rr_realized = None
-    if pips is not None and prediction.stop_loss and prediction.entry_price:
-        risk_pips = abs(prediction.entry_price - prediction.stop_loss) / 0.01
-        if risk_pips > 0:
-            rr_realized = pips / risk_pips
-
-    # Confidence calibration
-    conf_calibration = None
-    if prediction.confidence_score is not None:
-        actual_accuracy = 1.0 if direction_correct else 0.0
-        conf_calibration = abs(prediction.confidence_score - actual_accuracy)
-
-    metrics = TradeMetrics(
-        direction_correct=direction_correct,
-        entry_timing_score=entry_timing,
-        pips_outcome=pips,
-        risk_reward_realized=rr_realized,
-        confidence_calibration=conf_calibration
+    return evaluate_many(
+        [prediction],
+        [actual],
+        market_regime=market_regime,
+        event_proximity=event_proximity
+    )[0]
+
+
+@lru_cache(maxsize=256)
+def _classify_modification_type(modification_type: str) -> Optional[str]:
+    """Intervention type for one modification_type string (risk > aggressive > cancellation)
+
+    modification_type values come from a small vocabulary, so each distinct
+    string is scanned by the regex only once.
+    """
+    found = {m.lastgroup for m in _INTERVENTION_RE.finditer(modification_type)}
+    for group, intervention_type in _INTERVENTION_TYPES:
+        if group in found:
+            return intervention_type
+    return None
+
+
+def _classify_intervention(modifications: List[dict]) -> Optional[str]:
+    """Classify a HITL intervention from its modifications (last match wins)"""
+    for mod in reversed(modifications):
+        intervention_type = _classify_modification_type(mod.get("modification_type", ""))
+        if intervention_type is not None:
+            return intervention_type
+    return None
+
+
+def evaluate_many(
+    predictions: List[PredictionInput],
+    actuals: List[ActualOutcome],
+    market_regime: Optional[str] = None,
+    event_proximity: bool = False
+) -> List[EvaluationResult]:
+    """Evaluate a batch of predictions against their actual outcomes
+
+    Metrics come from one evaluate_batch pass and the evaluation date and
+    generation timestamp are taken once for the whole batch.
+
+    Args:
+        predictions: L3 or L4 predictions
+        actuals: Actual market outcomes, aligned with ``predictions``
+        market_regime: Market regime during the trades
+        event_proximity: Whether a high-impact event was near
+
+    Returns:
+        EvaluationResult for each prediction, in input order
+    """
+    all_metrics = evaluate_batch(predictions, actuals)
+    today_str = datetime.now().strftime("%Y-%m-%d")
+    generated_at = get_jst_now().isoformat()
+
+    results = []
+    for prediction, actual, metrics in zip(predictions, actuals, all_metrics):
+        # HITL intervention analysis
+        modifications = prediction.modifications
+        intervention_type = None
+        intervention_success = None
+        if modifications:
+            intervention_type = _classify_intervention(modifications)
+            # Determine intervention success
+            # (Simplified: if direction correct after intervention, it's success)
+            intervention_success = metrics.direction_correct
+
+        results.append(EvaluationResult(
+            date=today_str,
+            pair=prediction.pair,
+            mode="hitl" if modifications else "ai",
+            prediction=prediction,
+            actual=actual,
+            metrics=metrics,
+            market_regime=market_regime,
+            event_proximity=event_proximity,
+            intervention_type=intervention_type,
+            intervention_success=intervention_success,
+            generated_at=generated_at
+        ))
+
+    return results
+
+
+def _optional_column(values) -> np.ndarray:
+    """Float column with NaN in place of None"""
+    return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+
+def evaluate_batch(
+    predictions: List[PredictionInput],
+    actuals: List[ActualOutcome]
+) -> List[TradeMetrics]:
+    """Evaluate many prediction/outcome pairs in one vectorized pass
+
+    Produces the same TradeMetrics as evaluate_single_trade for each pair,
+    with the per-trade helpers replaced by array arithmetic over all trades.
+
+    Args:
+        predictions: Predictions to evaluate
+        actuals: Actual outcomes, aligned with ``predictions``
+
+    Returns:
+        TradeMetrics for each prediction, in input order
+    """
+    if len(predictions) != len(actuals):
+        raise ValueError("predictions and actuals must have the same length")
+    if not predictions:
+        return []
+
+    codes = np.fromiter(
+        (p.direction_code for p in predictions), dtype=np.int8, count=len(predictions)
+    )
+    is_wait = codes == _DIR_WAIT
+    is_long = codes == _DIR_LONG
+    is_short = codes == _DIR_SHORT
+
+    entry = _optional_column(p.entry_price for p in predictions)
+    stop_loss = _optional_column(p.stop_loss for p in predictions)
+    take_profit = _optional_column(p.take_profit for p in predictions)
+    open_ = np.array([a.open_price for a in actuals], dtype=np.float64)
+    high = np.array([a.high_price for a in actuals], dtype=np.float64)
+    low = np.array([a.low_price for a in actuals], dtype=np.float64)
+    close = np.array([a.close_price for a in actuals], dtype=np.float64)
+    period_return = np.array([a.period_return for a in actuals], dtype=np.float64)
+    pip_values = np.fromiter(
+        (p.pip_value for p in predictions), dtype=np.float64, count=len(predictions)
     )
 
-    # HITL intervention analysis
-    intervention_type = None
-    intervention_success = None
-    if prediction.modifications:
-        # Classify intervention type based on modifications
-        for mod in prediction.modifications:
-            mod_type = mod.get("modification_type", "")
-            if "risk" in mod_type.lower():
-                intervention_type = "risk_reduction"
-            elif "aggressive" in mod_type.lower():
-                intervention_type = "aggressive_adjustment"
-            elif "cancellation" in mod_type.lower() or "wait" in mod_type.lower():
-                intervention_type = "trade_cancellation"
-
-        # Determine intervention success
-        # (Simplified: if direction correct after intervention, it's success)
-        intervention_success = direction_correct
-
-    mode = "hitl" if prediction.modifications else "ai"
-
-    return EvaluationResult(
-        date=datetime.now().strftime("%Y-%m-%d"),
-        pair=prediction.pair,
-        mode=mode,
-        prediction=prediction,
-        actual=actual,
-        metrics=metrics,
-        market_regime=market_regime,
-        event_proximity=event_proximity,
-        intervention_type=intervention_type,
-        intervention_success=intervention_success
+    # Direction accuracy (WAIT is correct when the move stayed within 0.5%)
+    direction_correct = np.where(
+        is_wait,
+        np.abs(period_return) < 0.005,
+        np.where(is_long, close > open_, is_short & (close < open_)),
     )
 
+    # Timing and pips only apply to trades with an entry price
+    traded = ~is_wait & ~np.isnan(entry)
+    sl_set = ~np.isnan(stop_loss) & (stop_loss != 0)
+    tp_set = ~np.isnan(take_profit) & (take_profit != 0)
+
+    # Express every trade as a long: flipping the sign of SHORT prices turns
+    # "high >= level" into "-high <= -level", so one comparison serves both
+    # sides (negation is exact, results are unchanged)
+    sign = np.where(is_long, 1.0, -1.0)
+    ideal = np.where(is_long, low, high)  # adverse extreme
+    worst = np.where(is_long, high, low)  # favourable extreme
+
+    # Branchless timing score: a flat bar (zero span) divides by 1 and is then
+    # forced to 0.0, so no division-by-zero handling is needed
+    span = worst - ideal
+    flat = span == 0
+    timing = np.clip((entry - ideal) / np.where(flat, 1.0, span) * 2.0 - 1.0, -1.0, 1.0)
+    timing = np.where(flat, 0.0, timing)
+
+    stop_hit = sl_set & (sign * ideal <= sign * stop_loss)
+    target_hit = tp_set & (sign * worst >= sign * take_profit)
+    exit_price = np.where(stop_hit, stop_loss, np.where(target_hit, take_profit, close))
+    # Subtract in trade direction rather than multiplying by sign, which would
+    # turn a flat SHORT result into -0.0
+    pips = np.where(is_long, exit_price - entry, entry - exit_price)
+    np.divide(pips, pip_values, out=pips)
+    risk_pips = np.subtract(entry, stop_loss)
+    np.abs(risk_pips, out=risk_pips)
+    np.divide(risk_pips, pip_values, out=risk_pips)
+    has_risk = sl_set & (entry != 0) & (risk_pips > 0)
+
+    # Convert each column to Python scalars in one C-level tolist() call rather
+    # than indexing numpy scalars per row. Rounding stays on the builtin
+    # round(): np.round (scale, rint, unscale) can differ from it on values
+    # that sit just below a decimal half-way point.
+    results = []
+    for prediction, correct, traded_i, timing_i, pips_raw, has_risk_i, risk_i in zip(
+        predictions,
+        direction_correct.tolist(),
+        traded.tolist(),
+        timing.tolist(),
+        pips.tolist(),
+        has_risk.tolist(),
+        risk_pips.tolist(),
+    ):
+        entry_timing = pips_i = rr_realized = None
+        if traded_i:
+            entry_timing = round(timing_i, 3)
+            pips_i = round(pips_raw, 1)
+            if has_risk_i:
+                rr_realized = pips_i / risk_i
+
+        conf_calibration = None
+        if prediction.confidence_score is not None:
+            conf_calibration = abs(prediction.confidence_score - (1.0 if correct else 0.0))
+
+        results.append(TradeMetrics(
+            direction_correct=correct,
+            entry_timing_score=entry_timing,
+            pips_outcome=pips_i,
+            risk_reward_realized=rr_realized,
+            confidence_calibration=conf_calibration
+        ))
+
+    return results
+
+
+def _nan_mean_or_zero(values: np.ndarray) -> float:
+    """Mean of the non-NaN entries, 0.0 when there are none"""
+    present = values[~np.isnan(values)]
+    return float(present.mean()) if present.size else 0.0
+
+
+def _tally_by_group(
+    labels: Iterable[Optional[str]], flags: np.ndarray
+) -> Dict[str, Tuple[int, int]]:
+    """(hit_count, total_count) per non-empty label
+
+    Labels are factorized to integer codes in first-seen order, then the
+    counts come from two np.bincount reductions over ``flags``.
+    """
+    codes: Dict[str, int] = {}
+    label_codes = np.fromiter(
+        (codes.setdefault(label, len(codes)) if label else -1 for label in labels),
+        dtype=np.intp,
+        count=len(flags),
+    )
+    keep = label_codes >= 0
+    label_codes = label_codes[keep]
+    counts = np.bincount(label_codes, minlength=len(codes))
+    hits = np.bincount(label_codes, weights=flags[keep], minlength=len(codes))
+    return {label: (int(hits[code]), int(counts[code])) for label, code in codes.items()}
+
+
+@dataclass(slots=True)
+class _EvaluationColumns:
+    """The flat per-trade fields aggregation needs, one column per field
+
+    Columns are preallocated to the expected size and filled by row index,
+    so aggregation reduces contiguous arrays instead of walking
+    EvaluationResult objects.
+    """
+    direction_correct: np.ndarray  # bool
+    confidence: np.ndarray  # float, NaN when missing
+    calibration: np.ndarray  # float, NaN when missing
+    intervention_success: np.ndarray  # bool
+    market_regime: List[Optional[str]]
+    intervention_type: List[Optional[str]]
+    size: int = 0
+
+    @classmethod
+    def allocate(cls, capacity: int) -> "_EvaluationColumns":
+        return cls(
+            direction_correct=np.zeros(capacity, dtype=bool),
+            confidence=np.full(capacity, np.nan),
+            calibration=np.full(capacity, np.nan),
+            intervention_success=np.zeros(capacity, dtype=bool),
+            market_regime=[None] * capacity,
+            intervention_type=[None] * capacity,
+        )
+
+    def append(self, result: EvaluationResult) -> None:
+        i = self.size
+        metrics = result.metrics
+        self.direction_correct[i] = bool(metrics.direction_correct)
+        if result.prediction.confidence_score is not None:
+            self.confidence[i] = result.prediction.confidence_score
+        if metrics.confidence_calibration is not None:
+            self.calibration[i] = metrics.confidence_calibration
+        self.intervention_success[i] = bool(result.intervention_success)
+        self.market_regime[i] = result.market_regime
+        self.intervention_type[i] = result.intervention_type
+        self.size = i + 1
+
 
 def aggregate_evaluations(
     evaluations: List[EvaluationResult],
@@ -423,7 +787,16 @@ def aggregate_evaluations(
     Returns:
         AggregatedMetrics with summary statistics
     """
-    if not evaluations:
+    columns = _EvaluationColumns.allocate(len(evaluations))
+    for evaluation in evaluations:
+        columns.append(evaluation)
+    return _aggregate_columns(columns, mode)
+
+
+def _aggregate_columns(columns: _EvaluationColumns, mode: str) -> AggregatedMetrics:
+    """Aggregate the first ``columns.size`` rows with numpy reductions"""
+    total = columns.size
+    if not total:
         return AggregatedMetrics(
             total_trades=0,
             direction_accuracy=0.0,
@@ -431,27 +804,20 @@ def aggregate_evaluations(
             avg_confidence_calibration=0.0
         )
 
-    total = len(evaluations)
-    correct = sum(1 for e in evaluations if e.metrics.direction_correct)
-    direction_accuracy = correct / total if total > 0 else 0.0
-
-    # Average confidence
-    confidences = [e.prediction.confidence_score for e in evaluations
-                   if e.prediction.confidence_score is not None]
-    avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+    correct = columns.direction_correct[:total]
+    direction_accuracy = float(correct.mean())
 
-    # Average confidence calibration
-    calibrations = [e.metrics.confidence_calibration for e in evaluations
-                    if e.metrics.confidence_calibration is not None]
-    avg_calibration = sum(calibrations) / len(calibrations) if calibrations else 0.0
+    # Average confidence / calibration (missing values are NaN)
+    avg_confidence = _nan_mean_or_zero(columns.confidence[:total])
+    avg_calibration = _nan_mean_or_zero(columns.calibration[:total])
 
     # By market regime
-    accuracy_by_regime = {}
-    regimes = set(e.market_regime for e in evaluations if e.market_regime)
-    for regime in regimes:
-        regime_evals = [e for e in evaluations if e.market_regime == regime]
-        regime_correct = sum(1 for e in regime_evals if e.metrics.direction_correct)
-        accuracy_by_regime[regime] = regime_correct / len(regime_evals)
+    accuracy_by_regime = {
+        regime: hits / count
+        for regime, (hits, count) in _tally_by_group(
+            columns.market_regime[:total], correct
+        ).items()
+    }
 
     # HITL-specific metrics
     total_interventions = None
@@ -459,23 +825,21 @@ def aggregate_evaluations(
     intervention_impact = None
 
     if mode == "hitl":
-        interventions = [e for e in evaluations if e.intervention_type is not None]
-        total_interventions = len(interventions)
+        types = columns.intervention_type[:total]
+        intervened = np.fromiter((t is not None for t in types), dtype=bool, count=total)
+        total_interventions = int(intervened.sum())
 
         if total_interventions > 0:
-            successes = sum(1 for e in interventions if e.intervention_success)
-            intervention_success_rate = successes / total_interventions
+            successes = columns.intervention_success[:total][intervened]
+            intervention_success_rate = float(successes.mean())
 
             # Break down by intervention type
-            intervention_impact = {}
-            types = set(e.intervention_type for e in interventions if e.intervention_type)
-            for itype in types:
-                type_evals = [e for e in interventions if e.intervention_type == itype]
-                type_successes = sum(1 for e in type_evals if e.intervention_success)
-                intervention_impact[itype] = {
-                    "count": len(type_evals),
-                    "success_rate": type_successes / len(type_evals)
-                }
+            intervention_impact = {
+                itype: {"count": count, "success_rate": hits / count}
+                for itype, (hits, count) in _tally_by_group(
+                    (t for t in types if t is not None), successes
+                ).items()
+            }
 
     return AggregatedMetrics(
         total_trades=total,
@@ -498,12 +862,103 @@ def write_evaluation(result: EvaluationResult, output_path: Path) -> None:
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with output_path.open("w", encoding="utf-8") as f:
-        json.dump(result.to_dict(), f, ensure_ascii=False, indent=2)
+    json_utils.dump_json_file(result.to_dict(), output_path, indent=2, ensure_ascii=False)
 
     logger.info(f"Wrote evaluation to {output_path}")
 
 
+# Per-mode file names used by --batch-dir (prediction file, evaluation output)
+_BATCH_FILES = {
+    "ai": ("L3_prediction.json", "L4_ai_evaluation.json"),
+    "hitl": ("L4_tradeplan.json", "L4_hitl_evaluation.json"),
+}
+_ACTUAL_FILE = "ohlc_summary.json"
+
+
+def find_batch_tasks(batch_dir: Path, mode: str) -> List[Tuple[Path, Path, str, Path]]:
+    """Pair each dated prediction with the next directory's OHLC summary
+
+    Args:
+        batch_dir: Directory containing one sub-directory per date
+        mode: "ai" (L3) or "hitl" (L4)
+
+    Returns:
+        (prediction_path, actual_path, mode, output_path) tuples in date order
+    """
+    prediction_name, output_name = _BATCH_FILES[mode]
+    day_dirs = sorted(p for p in batch_dir.iterdir() if p.is_dir())
+
+    tasks = []
+    for i, day_dir in enumerate(day_dirs):
+        prediction_path = day_dir / prediction_name
+        if not prediction_path.is_file():
+            continue
+        # The outcome is the next trading day's summary (skips gaps such as weekends)
+        actual_path = next(
+            (d / _ACTUAL_FILE for d in day_dirs[i + 1:] if (d / _ACTUAL_FILE).is_file()),
+            None
+        )
+        if actual_path is None:
+            logger.warning(f"No later {_ACTUAL_FILE} for {prediction_path}, skipping")
+            continue
+        tasks.append((prediction_path, actual_path, mode, day_dir / output_name))
+    return tasks
+
+
+def _evaluate_one(
+    task: Tuple[Path, Path, str, Path]
+) -> Tuple[Path, Optional[EvaluationResult], Optional[str]]:
+    """Evaluate and write one prediction file (top-level so worker processes can pickle it)"""
+    prediction_path, actual_path, mode, output_path = task
+    try:
+        prediction = load_prediction(prediction_path, mode)
+        actual = load_actual_outcome(actual_path, prediction.pair)
+        result = evaluate_single_trade(prediction, actual)
+        write_evaluation(result, output_path)
+        return prediction_path, result, None
+    except Exception as exc:  # reported by the parent, one bad day must not stop the batch
+        return prediction_path, None, str(exc)
+
+
+def run_batch(
+    batch_dir: Path,
+    mode: str,
+    output_path: Optional[Path] = None,
+    max_workers: Optional[int] = None
+) -> AggregatedMetrics:
+    """Evaluate all dated predictions under a directory across worker processes
+
+    Args:
+        batch_dir: Directory containing one sub-directory per date
+        mode: "ai" (L3) or "hitl" (L4)
+        output_path: Optional path for the aggregated metrics JSON
+        max_workers: Worker process count (defaults to the CPU count)
+
+    Returns:
+        AggregatedMetrics over every successful evaluation
+    """
+    tasks = find_batch_tasks(batch_dir, mode)
+    # Each result is already written by its worker; only the aggregation
+    # columns are kept here
+    columns = _EvaluationColumns.allocate(len(tasks))
+
+    if tasks:
+        workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for prediction_path, result, error in executor.map(_evaluate_one, tasks, chunksize=4):
+                if result is None:
+                    logger.error(f"Evaluation failed for {prediction_path}: {error}")
+                    continue
+                columns.append(result)
+
+    aggregated = _aggregate_columns(columns, mode)
+    if output_path is not None:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        json_utils.dump_json_file(aggregated.to_dict(), output_path, indent=2, ensure_ascii=False)
+        logger.info(f"Wrote aggregated metrics to {output_path}")
+    return aggregated
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     """CLI entry point
 
@@ -522,20 +977,28 @@ def main(argv: Optional[List[str]] = None) -> int:
     parser.add_argument(
         "--prediction",
         type=Path,
-        required=True,
         help="Path to prediction file (L3_prediction.json or L4_tradeplan.json)"
     )
     parser.add_argument(
         "--actual",
         type=Path,
-        required=True,
         help="Path to actual outcome file (e.g., next day's ohlc_summary.json)"
     )
     parser.add_argument(
         "--output",
         type=Path,
-        required=True,
-        help="Path to output evaluation file"
+        help="Path to output evaluation file (aggregated metrics with --batch-dir)"
+    )
+    parser.add_argument(
+        "--batch-dir",
+        type=Path,
+        help="Evaluate every dated sub-directory in parallel instead of a single file"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for --batch-dir (default: CPU count)"
     )
     parser.add_argument(
         "--market-regime",
@@ -554,12 +1017,24 @@ def main(argv: Optional[List[str]] = None) -> int:
     )
 
     args = parser.parse_args(argv)
+    if args.batch_dir is None and not (args.prediction and args.actual and args.output):
+        parser.error("--prediction, --actual and --output are required without --batch-dir")
 
     logging.basicConfig(
         level=logging.DEBUG if args.verbose else logging.INFO,
         format="%(asctime)s %(levelname)s %(message)s"
     )
 
+    if args.batch_dir is not None:
+        try:
+            aggregated = run_batch(args.batch_dir, args.mode, args.output, args.workers)
+        except Exception as exc:
+            logger.error(f"Batch evaluation failed: {exc}", exc_info=True)
+            return 1
+        print(f"Evaluated {aggregated.total_trades} prediction(s) in {args.batch_dir}")
+        print(f"Direction accuracy: {aggregated.direction_accuracy:.1%}")
+        return 0
+
     try:
         # Load prediction
         prediction = load_prediction(args.prediction, args.mode)
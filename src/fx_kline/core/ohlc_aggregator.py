@@ -14,16 +14,21 @@ Outputs a JSON document (schema_version=2.1) per input file with:
 from __future__ import annotations
 
 import argparse
-import json
 import logging
+import os
 import re
+from bisect import bisect_left, insort
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
+from . import json_utils
 from .timezone_utils import get_jst_now
 
 # Expected column names (normalized to lowercase)
@@ -41,6 +46,10 @@ DAILY_LOOKBACK_BARS = 42  # ~2 months (trading days) for 1d interval
 
 DAILY_REVERSAL_CANDLES = 3  # Consecutive candles for reversal
 
+# Weekly bucketing for 4h levels (1970-01-01 was a Thursday; +3 aligns weeks to Monday)
+_NS_PER_DAY = 86_400 * 1_000_000_000
+_EPOCH_WEEKDAY_OFFSET = 3
+
 # Label for daily analysis period (analysis uses last 42 bars even if CSV holds more)
 DAILY_ANALYSIS_PERIOD_LABEL = "42bars"
 
@@ -75,7 +84,7 @@ SLOPE_STRONG_DOWN = -0.002
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     pair: str
     interval: str
@@ -100,26 +109,30 @@ class AnalysisResult:
         return data
 
 
+@lru_cache(maxsize=1024)
+def _parse_stem(stem: str) -> Optional[Tuple[str, str, str]]:
+    """Match a filename stem once per distinct stem; None when it does not fit the pattern."""
+    match = _FILENAME_PATTERN.match(stem)
+    if not match:
+        return None
+    return match.group("pair").upper(), match.group("interval"), match.group("period")
+
+
 def parse_metadata_from_filename(file_path: Path) -> Tuple[str, str, str]:
     """
     Extract pair, interval, and period from a CSV filename.
     Expected pattern: <PAIR>_<INTERVAL>_<PERIOD>.csv (e.g., USDJPY_1h_10d.csv)
     """
-    match = _FILENAME_PATTERN.match(file_path.stem)
-    if not match:
+    metadata = _parse_stem(file_path.stem)
+    if metadata is None:
         raise ValueError(
             f"Filename '{file_path.name}' does not match '<PAIR>_<INTERVAL>_<PERIOD>.csv'"
         )
-
-    pair = match.group("pair").upper()
-    interval = match.group("interval")
-    period = match.group("period")
-    return pair, interval, period
+    return metadata
 
 
 def _normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """Lowercase and strip column names for consistent downstream access."""
-    df = df.copy()
+    """Lowercase and strip column names in place for consistent downstream access."""
     df.columns = [str(col).strip().lower() for col in df.columns]
     return df
 
@@ -133,12 +146,11 @@ def load_ohlc_csv(file_path: Path) -> pd.DataFrame:
     if missing:
         raise ValueError(f"Missing required columns {sorted(missing)} in {file_path.name}")
 
+    # Coerce every column on the freshly read frame, then drop invalid rows in a single pass
     df["datetime"] = pd.to_datetime(df["datetime"], errors="coerce", utc=True)
-    df = df.dropna(subset=["datetime"])
-
     for price_col in ["open", "high", "low", "close", "volume"]:
         df[price_col] = pd.to_numeric(df[price_col], errors="coerce")
-    df = df.dropna(subset=["open", "high", "low", "close"])
+    df = df.dropna(subset=["datetime", "open", "high", "low", "close"])
 
     return df.sort_values("datetime").reset_index(drop=True)
 
@@ -275,6 +287,12 @@ def _get_time_column(df: pd.DataFrame) -> str:
     raise ValueError("DataFrame must include a 'datetime' or 'timestamp' column")
 
 
+def _is_utc_datetime(series: pd.Series) -> bool:
+    """Return True when the series is already tz-aware datetime64 in UTC."""
+    dtype = series.dtype
+    return isinstance(dtype, pd.DatetimeTZDtype) and str(dtype.tz) == "UTC"
+
+
 def _rank_levels(
     candidates: List[Tuple[float, pd.Timestamp]],
     last_close: float,
@@ -304,16 +322,13 @@ def _rank_levels(
     if not candidates:
         return []
 
-    # Deduplicate candidates
-    seen = set()
-    unique: List[Tuple[float, pd.Timestamp]] = []
+    # Deduplicate candidates on the rounded price itself (first occurrence wins)
+    unique_by_price: dict = {}
     for price, ts in candidates:
         rounded = round(float(price), 4)
-        key = f"{rounded:.4f}"
-        if key in seen:
-            continue
-        seen.add(key)
-        unique.append((rounded, pd.Timestamp(ts)))
+        if rounded not in unique_by_price:
+            unique_by_price[rounded] = (rounded, pd.Timestamp(ts))
+    unique: List[Tuple[float, pd.Timestamp]] = list(unique_by_price.values())
 
     # Apply price constraints (filter before ranking)
     filtered = unique
@@ -327,15 +342,23 @@ def _rank_levels(
     if not filtered and unique:
         return []
 
-    # Sort based on mode
+    # Sort based on mode. Keys are built once with integer nanoseconds; the position
+    # breaks full ties so the order matches a stable sort.
     if mode == "structure_first":
         # Structure priority: older levels first (necklines), then proximity
-        ranked = sorted(filtered, key=lambda item: (item[1].timestamp(), abs(item[0] - last_close)))
+        keyed = [
+            (ts.value, abs(price - last_close), pos, price)
+            for pos, (price, ts) in enumerate(filtered)
+        ]
     else:  # mode == "distance"
         # Distance priority: closest to current price first, then recency
-        ranked = sorted(filtered, key=lambda item: (abs(item[0] - last_close), -item[1].timestamp()))
+        keyed = [
+            (abs(price - last_close), -ts.value, pos, price)
+            for pos, (price, ts) in enumerate(filtered)
+        ]
+    keyed.sort()
 
-    selected = [price for price, _ in ranked[:max_levels]]
+    selected = [item[-1] for item in keyed[:max_levels]]
     return sorted(selected, reverse=sort_desc)
 
 
@@ -386,12 +409,20 @@ def _merge_nearby_levels(
         return levels
 
     result: List[float] = [levels[0]]
+    # Ascending copy of result: a value is clear of every accepted level exactly when
+    # it is clear of its two neighbours here, so each check is a bisect instead of a scan
+    accepted: List[float] = [levels[0]]
+
+    def _is_clear(value: float) -> bool:
+        pos = bisect_left(accepted, value)
+        if pos < len(accepted) and accepted[pos] - value < tolerance:
+            return False
+        return pos == 0 or value - accepted[pos - 1] >= tolerance
 
     for candidate in levels[1:]:
-        # Check if candidate is too close to any existing result level
-        too_close = any(abs(candidate - existing) < tolerance for existing in result)
-        if not too_close:
+        if _is_clear(candidate):
             result.append(candidate)
+            insort(accepted, candidate)
 
     # If we lost levels due to merging, try to find alternatives
     if len(result) < len(levels):
@@ -399,9 +430,9 @@ def _merge_nearby_levels(
         for alt in all_sorted:
             if len(result) >= len(levels):
                 break
-            # Check if this alternative is sufficiently distant from all existing levels
-            if all(abs(alt - existing) >= tolerance for existing in result):
+            if _is_clear(alt):
                 result.append(alt)
+                insort(accepted, alt)
 
     # Re-sort the result
     result = sorted(result, reverse=not is_support)
@@ -515,8 +546,8 @@ def _compute_intraday_reversals(
         2. Support/Resistance #2: extremes from last 48 bars.
         3. Deduplicate with ATR-based tolerance (ATR * 1.5) when available.
     """
-    window_primary = df.tail(INTRADAY_LOOKBACK_BARS).copy()
-    window_secondary = df.tail(INTRADAY_SECONDARY_LOOKBACK_BARS).copy()
+    window_primary = df.tail(INTRADAY_LOOKBACK_BARS)
+    window_secondary = df.tail(INTRADAY_SECONDARY_LOOKBACK_BARS)
     tolerance = (atr * LEVEL_MERGE_ATR_MULTIPLIER) if atr is not None else 0.0
 
     supports: List[float] = []
@@ -581,36 +612,30 @@ def _compute_four_hour_levels(
     Returns:
         Tuple of (support_levels, resistance_levels) sorted for readability
     """
-    window = df.tail(FOUR_HOUR_LOOKBACK_BARS).copy()
-    # Note: to_period("W-SUN") drops timezone info, but this is acceptable for weekly grouping
-    window["week"] = window[ts_col].dt.to_period("W-SUN")
-
-    weekly = (
-        window.groupby("week")
-        .agg(
-            week_high=("high", "max"),
-            week_low=("low", "min"),
-            week_end=(ts_col, "max"),
-        )
-        .reset_index()
-        .sort_values("week")
-    )
+    window = df.tail(FOUR_HOUR_LOOKBACK_BARS)
+
+    # Monday-start (W-SUN) weeks on the UTC wall clock, numbered straight from epoch
+    # nanoseconds; the window is time-sorted, so each week is a contiguous run of rows
+    epoch_days = window[ts_col].to_numpy(dtype="datetime64[ns]").view("int64") // _NS_PER_DAY
+    week_ids = (epoch_days + _EPOCH_WEEKDAY_OFFSET) // 7
+    week_starts = np.flatnonzero(np.r_[True, week_ids[1:] != week_ids[:-1]])
+    week_highs = np.maximum.reduceat(window["high"].to_numpy(dtype=np.float64), week_starts)
+    week_lows = np.minimum.reduceat(window["low"].to_numpy(dtype=np.float64), week_starts)
+    week_last_rows = np.r_[week_starts[1:], window.shape[0]] - 1
 
     support_candidates: List[Tuple[float, pd.Timestamp]] = []
     resistance_candidates: List[Tuple[float, pd.Timestamp]] = []
 
-    if weekly.shape[0] >= 2:
-        last_week = weekly.iloc[-1]
-        prev_week = weekly.iloc[-2]
+    if week_starts.shape[0] >= 2:
+        prev_high, last_high = week_highs[-2:].tolist()
+        prev_low, last_low = week_lows[-2:].tolist()
+        week_ends = [
+            pd.Timestamp(ts) for ts in window[ts_col].take(week_last_rows[-2:]).tolist()
+        ]
 
-        if last_week.week_high > prev_week.week_high or last_week.week_low < prev_week.week_low:
-            for week_row in (prev_week, last_week):
-                support_candidates.append(
-                    (float(week_row.week_low), pd.Timestamp(week_row.week_end))
-                )
-                resistance_candidates.append(
-                    (float(week_row.week_high), pd.Timestamp(week_row.week_end))
-                )
+        if last_high > prev_high or last_low < prev_low:
+            support_candidates = list(zip((prev_low, last_low), week_ends))
+            resistance_candidates = list(zip((prev_high, last_high), week_ends))
 
     if not support_candidates and not resistance_candidates:
         fallback_supports, fallback_resistances = _fallback_extremes(window, levels)
@@ -678,54 +703,47 @@ def _compute_daily_reversals(
         Tuple of (support_levels, resistance_levels)
         May return fewer than 'levels' if only limited qualified candidates exist
     """
-    window = df.tail(DAILY_LOOKBACK_BARS).copy()
-
-    support_candidates: List[Tuple[float, pd.Timestamp]] = []
-    resistance_candidates: List[Tuple[float, pd.Timestamp]] = []
-
-    for idx in range(window.shape[0] - DAILY_REVERSAL_CANDLES):
-        current_row = window.iloc[idx]
-        next_slice = window.iloc[idx + 1 : idx + 1 + DAILY_REVERSAL_CANDLES]
-        if next_slice.shape[0] < DAILY_REVERSAL_CANDLES:
-            break
-
-        is_bearish_follow_through = (
-            next_slice["close"] < next_slice["open"]
-        ).all()
-        is_bullish_follow_through = (
-            next_slice["close"] > next_slice["open"]
-        ).all()
-
-        high_price = float(current_row["high"])
-        low_price = float(current_row["low"])
-        timestamp = pd.Timestamp(current_row[ts_col])
+    window = df.tail(DAILY_LOOKBACK_BARS)
+
+    opens = window["open"].to_numpy(dtype=float)
+    highs = window["high"].to_numpy(dtype=float)
+    lows = window["low"].to_numpy(dtype=float)
+    closes = window["close"].to_numpy(dtype=float)
+
+    # Bar idx qualifies when the DAILY_REVERSAL_CANDLES bars after it all move one way;
+    # the candidate bars are the ones with a full follow-through window behind them
+    n_candidates = max(window.shape[0] - DAILY_REVERSAL_CANDLES, 0)
+    if n_candidates:
+        bearish_follow = sliding_window_view(
+            closes[1:] < opens[1:], DAILY_REVERSAL_CANDLES
+        ).all(axis=1)
+        bullish_follow = sliding_window_view(
+            closes[1:] > opens[1:], DAILY_REVERSAL_CANDLES
+        ).all(axis=1)
+    else:
+        bearish_follow = bullish_follow = np.zeros(0, dtype=bool)
 
-        if is_bearish_follow_through:
-            resistance_candidates.append((high_price, timestamp))
+    candidate_highs = highs[:n_candidates]
+    candidate_lows = lows[:n_candidates]
 
-        if is_bullish_follow_through:
-            support_candidates.append((low_price, timestamp))
+    # Price-direction filter: resistances must be >= last_close, supports <= last_close
+    resistance_mask = bearish_follow & (candidate_highs >= last_close)
+    support_mask = bullish_follow & (candidate_lows <= last_close)
 
     guardrail_distance = atr * 5 if atr is not None else None
     if guardrail_distance is not None:
-        support_candidates = [
-            (price, ts)
-            for price, ts in support_candidates
-            if abs(price - last_close) <= guardrail_distance
-        ]
-        resistance_candidates = [
-            (price, ts)
-            for price, ts in resistance_candidates
-            if abs(price - last_close) <= guardrail_distance
-        ]
-
-    # Apply price-direction filter: resistances must be >= last_close, supports <= last_close
-    resistance_candidates = [
-        (price, ts) for price, ts in resistance_candidates if price >= last_close
-    ]
-    support_candidates = [
-        (price, ts) for price, ts in support_candidates if price <= last_close
-    ]
+        resistance_mask &= np.abs(candidate_highs - last_close) <= guardrail_distance
+        support_mask &= np.abs(candidate_lows - last_close) <= guardrail_distance
+
+    timestamps = window[ts_col]
+    resistance_idx = np.flatnonzero(resistance_mask)
+    support_idx = np.flatnonzero(support_mask)
+    resistance_candidates: List[Tuple[float, pd.Timestamp]] = list(
+        zip(candidate_highs[resistance_idx].tolist(), timestamps.take(resistance_idx).tolist())
+    )
+    support_candidates: List[Tuple[float, pd.Timestamp]] = list(
+        zip(candidate_lows[support_idx].tolist(), timestamps.take(support_idx).tolist())
+    )
 
     supports = _rank_levels(
         support_candidates, last_close, levels, sort_desc=False, mode="structure_first"
@@ -797,8 +815,12 @@ def compute_support_resistance(
         Support: [149.20, 149.85], Resistance: [151.20, 150.95]
     """
     ts_col = _get_time_column(df)
-    working = df.copy()
-    working[ts_col] = pd.to_datetime(working[ts_col], errors="coerce", utc=True)
+    if _is_utc_datetime(df[ts_col]):
+        # Already parsed (e.g. by load_ohlc_csv); dropna/sort_values below return new frames
+        working = df
+    else:
+        working = df.copy()
+        working[ts_col] = pd.to_datetime(working[ts_col], errors="coerce", utc=True)
     working = working.dropna(subset=[ts_col, "high", "low", "close"]).sort_values(ts_col)
 
     if working.empty:
@@ -858,7 +880,8 @@ def compute_time_of_day_reversals(df: pd.DataFrame, ts_col: str) -> Optional[dic
         return None
 
     working["jst_ts"] = working[ts_col].dt.tz_convert("Asia/Tokyo")
-    working["session_date"] = working["jst_ts"].dt.date
+    # JST midnight as the session key keeps it datetime64 (dt.date yields Python objects)
+    working["session_date"] = working["jst_ts"].dt.normalize()
 
     session_dates = sorted(working["session_date"].unique())
     session_dates = session_dates[-TIME_OF_DAY_LOOKBACK_SESSIONS:]
@@ -871,38 +894,45 @@ def compute_time_of_day_reversals(df: pd.DataFrame, ts_col: str) -> Optional[dic
     sma5 = working["close"].rolling(window=5, min_periods=5).mean()
     working["sma5_dev_pct"] = (working["close"] - sma5) / sma5
 
+    hours = working["jst_ts"].dt.hour.to_numpy()
     hour_denominator = {}
-    for hour in working["jst_ts"].dt.hour:
+    for hour in hours.tolist():
         hour_denominator[hour] = hour_denominator.get(hour, 0) + 1
 
-    reversal_counts = {}
+    highs = working["high"].to_numpy(dtype=float)
+    lows = working["low"].to_numpy(dtype=float)
+    windows = np.array(
+        [_select_reversal_window(dev) for dev in working["sma5_dev_pct"].abs().tolist()]
+    )
 
-    for session_date in sorted(set(working["session_date"])):
-        daily = working[working["session_date"] == session_date]
-        if daily.empty:
+    # Rows are time-sorted, so each session is a contiguous block; one groupby pass gives
+    # every row its session position, bars left in the session and the running extremes
+    sessions = working.groupby("session_date", sort=False)
+    is_session_open = sessions.cumcount().to_numpy() == 0
+    bars_remaining = sessions.cumcount(ascending=False).to_numpy()
+    running_high = np.concatenate(([-np.inf], sessions["high"].cummax().to_numpy()[:-1]))
+    running_low = np.concatenate(([np.inf], sessions["low"].cummin().to_numpy()[:-1]))
+    new_high = is_session_open | (highs > running_high)
+    new_low = is_session_open | (lows < running_low)
+
+    # Confirmation: the next `window` bars of the same session never revisit the extreme.
+    # One sliding-window pass per window length (at most three) covers every row.
+    confirmed_high = np.zeros(highs.shape[0], dtype=bool)
+    confirmed_low = np.zeros(highs.shape[0], dtype=bool)
+    for window in np.unique(windows).tolist():
+        span = highs.shape[0] - window
+        if span <= 0:
             continue
-
-        day_high = -np.inf
-        day_low = np.inf
-
-        for idx, row in daily.iterrows():
-            price_high = float(row["high"])
-            price_low = float(row["low"])
-            ts_hour = int(row["jst_ts"].hour)
-            dev_abs = abs(float(row["sma5_dev_pct"])) if pd.notna(row["sma5_dev_pct"]) else None
-            window = _select_reversal_window(dev_abs)
-
-            if price_high > day_high:
-                day_high = price_high
-                confirm_slice = daily[daily.index > idx].head(window)
-                if confirm_slice.shape[0] >= window and confirm_slice["high"].max() < price_high:
-                    reversal_counts[ts_hour] = reversal_counts.get(ts_hour, 0) + 1
-
-            if price_low < day_low:
-                day_low = price_low
-                confirm_slice = daily[daily.index > idx].head(window)
-                if confirm_slice.shape[0] >= window and confirm_slice["low"].min() > price_low:
-                    reversal_counts[ts_hour] = reversal_counts.get(ts_hour, 0) + 1
+        eligible = (windows[:span] == window) & (bars_remaining[:span] >= window)
+        post_high = sliding_window_view(highs[1:], window).max(axis=1)
+        post_low = sliding_window_view(lows[1:], window).min(axis=1)
+        confirmed_high[:span] |= eligible & (post_high < highs[:span])
+        confirmed_low[:span] |= eligible & (post_low > lows[:span])
+
+    hour_counts = np.bincount(hours[new_high & confirmed_high], minlength=24) + np.bincount(
+        hours[new_low & confirmed_low], minlength=24
+    )
+    reversal_counts = {hour: count for hour, count in enumerate(hour_counts.tolist()) if count}
 
     if not reversal_counts:
         return None
@@ -969,16 +999,19 @@ def compute_atr(df: pd.DataFrame, period: int = 14) -> Optional[float]:
     if df.shape[0] < 2:
         return None
 
-    high = df["high"]
-    low = df["low"]
-    close = df["close"]
-
-    prev_close = close.shift(1)
-    tr_components = pd.concat(
-        [(high - low).abs(), (high - prev_close).abs(), (low - prev_close).abs()],
-        axis=1,
+    high = df["high"].to_numpy(dtype=float)
+    low = df["low"].to_numpy(dtype=float)
+    close = df["close"].to_numpy(dtype=float)
+
+    prev_close = np.empty_like(close)
+    prev_close[0] = np.nan
+    prev_close[1:] = close[:-1]
+    # fmax skips NaN like DataFrame.max(axis=1), so the first bar falls back to high - low
+    true_range = pd.Series(
+        np.fmax.reduce(
+            [np.abs(high - low), np.abs(high - prev_close), np.abs(low - prev_close)]
+        )
     )
-    true_range = tr_components.max(axis=1)
 
     atr_series = true_range.rolling(window=period, min_periods=min(period, len(true_range))).mean()
     atr_value = atr_series.dropna().iloc[-1] if not atr_series.dropna().empty else true_range.mean()
@@ -1188,8 +1221,22 @@ def collect_input_files(input_dir: Optional[Path], glob_patterns: Sequence[str],
 def write_analysis(result: AnalysisResult, destination: Path) -> None:
     """Write analysis to JSON with stable formatting."""
     destination.parent.mkdir(parents=True, exist_ok=True)
-    with destination.open("w", encoding="utf-8") as fp:
-        json.dump(result.to_dict(), fp, ensure_ascii=True, indent=2)
+    # Serialized in one call (orjson when installed) and written with a single write
+    json_utils.dump_json_file(result.to_dict(), destination, indent=2, ensure_ascii=True)
+
+
+def _analyze_and_write(task: Tuple[Path, Path]) -> Tuple[Path, Path, Optional[str]]:
+    """Analyze one CSV and write its JSON; runs inside a worker process when parallel."""
+    csv_path, output_path = task
+    try:
+        result = analyze_file(csv_path)
+    except Exception as exc:  # pylint: disable=broad-except
+        # Reported by the parent so one bad file does not stop the run
+        return csv_path, output_path, str(exc)
+
+    # Written by the worker so the AnalysisResult never has to be pickled back
+    write_analysis(result, output_path)
+    return csv_path, output_path, None
 
 
 def main(argv: Optional[Sequence[str]] = None) -> int:
@@ -1220,6 +1267,12 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         required=True,
         help="Directory to write JSON analysis outputs.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for analyzing files (default: CPU count; 1 runs serially).",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -1237,20 +1290,26 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     if not input_files:
         parser.error("No CSV files found. Provide --input-dir/--glob or --files.")
 
-    written = 0
+    tasks: List[Tuple[Path, Path]] = []
     for csv_path in input_files:
         if csv_path.suffix.lower() != ".csv":
             logger.debug("Skipping non-CSV file %s", csv_path)
             continue
+        tasks.append((csv_path, args.output_dir / f"{csv_path.stem}_analysis.json"))
 
-        try:
-            result = analyze_file(csv_path)
-        except Exception as exc:  # pylint: disable=broad-except
-            logger.error("Failed to analyze %s: %s", csv_path.name, exc)
-            continue
+    # Files are independent, so they fan out across processes; results come back in input order
+    workers = min(args.workers or os.cpu_count() or 1, max(len(tasks), 1))
+    if workers <= 1:
+        outcomes = [_analyze_and_write(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(_analyze_and_write, tasks))
 
-        output_path = args.output_dir / f"{csv_path.stem}_analysis.json"
-        write_analysis(result, output_path)
+    written = 0
+    for csv_path, output_path, error in outcomes:
+        if error is not None:
+            logger.error("Failed to analyze %s: %s", csv_path.name, error)
+            continue
         written += 1
         logger.info("Wrote analysis for %s -> %s", csv_path.name, output_path)
 
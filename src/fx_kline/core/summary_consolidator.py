@@ -17,6 +17,7 @@ from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Sequence
 
+from . import json_utils
 from .timezone_utils import get_jst_now
 
 logger = logging.getLogger(__name__)
@@ -27,7 +28,7 @@ _TIMEFRAME_ORDER = ["1d", "4h", "1h"]  # Macro to micro view
 _CONSOLIDATION_VERSION = "1.2.0"
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeframeAnalysis:
     """Single timeframe data extracted from individual analysis JSON."""
     interval: str
@@ -45,7 +46,7 @@ class TimeframeAnalysis:
     time_of_day: Optional[dict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsolidatedSummary:
     """Multi-timeframe summary for a single currency pair."""
     pair: str
@@ -118,9 +119,8 @@ def load_analysis_file(file_path: Path) -> Optional[TimeframeAnalysis]:
         TimeframeAnalysis object or None if loading fails
     """
     try:
-        with file_path.open("r", encoding="utf-8") as fp:
-            data = json.load(fp)
-    except json.JSONDecodeError as exc:
+        data = json_utils.load_json_file(file_path)
+    except json.JSONDecodeError as exc:  # orjson's decode error subclasses this too
         logger.error(f"Corrupt JSON in {file_path.name}: {exc}")
         return None
     except OSError as exc:
@@ -249,8 +249,8 @@ def write_summary(summary: ConsolidatedSummary, output_path: Path) -> None:
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with output_path.open("w", encoding="utf-8") as fp:
-        json.dump(summary.to_dict(), fp, ensure_ascii=True, indent=2)
+    # Serialized in one call (orjson when installed) and written with a single write
+    json_utils.dump_json_file(summary.to_dict(), output_path, indent=2, ensure_ascii=True)
 
     logger.debug(f"Wrote summary to {output_path}")
 
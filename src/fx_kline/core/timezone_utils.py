@@ -3,16 +3,20 @@ Timezone utilities for FX-Kline
 Handles UTC to JST conversion with DST (daylight saving time) awareness
 """
 
-from datetime import datetime, timedelta
-import pytz
-import pandas as pd
-from typing import Optional
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:  # pandas is imported lazily; most helpers here only need datetime
+    import pandas as pd
 
 
 # Timezone objects
-UTC_TZ = pytz.UTC
-JST_TZ = pytz.timezone('Asia/Tokyo')
-US_EASTERN_TZ = pytz.timezone('US/Eastern')
+UTC_TZ = timezone.utc
+JST_TZ = ZoneInfo('Asia/Tokyo')
+US_EASTERN_TZ = ZoneInfo('US/Eastern')
 
 
 def utc_to_jst(dt: datetime) -> datetime:
@@ -27,7 +31,7 @@ def utc_to_jst(dt: datetime) -> datetime:
     """
     # If naive, assume UTC
     if dt.tzinfo is None:
-        dt = UTC_TZ.localize(dt)
+        dt = dt.replace(tzinfo=UTC_TZ)
     elif dt.tzinfo != UTC_TZ:
         # Convert to UTC first
         dt = dt.astimezone(UTC_TZ)
@@ -46,8 +50,8 @@ def convert_dataframe_to_jst(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         DataFrame with DatetimeIndex in JST
     """
-    # Create a copy to avoid modifying original
-    df_copy = df.copy()
+    # Shallow copy: only the index is replaced, so the column data can be shared
+    df_copy = df.copy(deep=False)
 
     # If index is not timezone-aware, assume UTC
     if df_copy.index.tzinfo is None:
@@ -107,7 +111,7 @@ def is_us_dst_active(dt: Optional[datetime] = None) -> bool:
         dt = datetime.now(US_EASTERN_TZ)
     else:
         if dt.tzinfo is None:
-            dt = UTC_TZ.localize(dt)
+            dt = dt.replace(tzinfo=UTC_TZ)
         dt = dt.astimezone(US_EASTERN_TZ)
 
     return bool(dt.dst())
@@ -123,7 +127,7 @@ def format_timestamp_jst(dt: datetime) -> str:
     Returns:
         Formatted string in JST
     """
-    jst_dt = utc_to_jst(dt) if dt.tzinfo is not None else JST_TZ.localize(dt)
+    jst_dt = utc_to_jst(dt) if dt.tzinfo is not None else dt.replace(tzinfo=JST_TZ)
     return jst_dt.strftime("%Y-%m-%d %H:%M:%S %Z")
 
 
@@ -144,6 +148,8 @@ def get_business_day_offset_jst(days: int) -> datetime:
     """
     today_jst = get_jst_now().replace(hour=0, minute=0, second=0, microsecond=0)
 
+    import pandas as pd
+
     # Use pandas business day offset
     offset = pd.tseries.offsets.BDay(days)
     target_date = today_jst - offset
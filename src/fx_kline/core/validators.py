@@ -2,6 +2,7 @@
 Input validators for FX-Kline
 """
 
+import re
 from typing import List, Set
 
 
@@ -54,6 +55,9 @@ DEFAULT_TIMEFRAME_BUSINESS_DAYS = {
 
 FALLBACK_TIMEFRAME_BUSINESS_DAYS = 5
 
+# Period format "<count><unit>" (e.g. 5d, 3mo), compiled once at import
+_PERIOD_PATTERN = re.compile(r"^(\d+)([a-z]+)$")
+
 
 class ValidationError(Exception):
     """Custom validation error"""
@@ -130,11 +134,8 @@ def validate_period(period: str) -> str:
     # yfinance accepts periods like: 1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max
     period_lower = period.lower()
 
-    valid_periods = {"d", "mo", "y", "ytd", "max"}
-
     # Extract the unit
-    import re
-    match = re.match(r"^(\d+)([a-z]+)$", period_lower)
+    match = _PERIOD_PATTERN.match(period_lower)
 
     if not match and period_lower != "ytd" and period_lower != "max":
         raise ValidationError(
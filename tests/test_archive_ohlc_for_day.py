@@ -5,6 +5,7 @@ from datetime import date
 from pathlib import Path
 
 import pandas as pd
+import pytest
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 SRC_PATH = PROJECT_ROOT / "src"
@@ -18,27 +19,28 @@ from fx_kline.analyst import data_manager  # noqa: E402
 import scripts.archive_ohlc_for_day as archive_ohlc_for_day  # noqa: E402
 
 
+def _fake_fetch(*args, **kwargs):
+    # Predictable data covering the target date
+    idx = pd.DatetimeIndex(
+        [
+            "2025-11-27 00:00:00+09:00",
+            "2025-11-27 00:15:00+09:00",
+        ]
+    )
+    df = pd.DataFrame(
+        {"Open": [1.0, 1.1], "High": [1.2, 1.2], "Low": [0.9, 1.0], "Close": [1.05, 1.1], "Volume": [10, 12]},
+        index=idx,
+    )
+    return {"USDJPY": df}
+
+
 def test_archive_ohlc_for_day_creates_csv(monkeypatch, tmp_path):
     target_date = date(2025, 11, 27)
     market_date = date(2025, 11, 28)
 
     # Redirect data root
     monkeypatch.setattr(data_manager, "get_data_root", lambda: tmp_path / "data")
-
-    # Mock fetcher to return predictable data (covering target_date)
-    def _fake_fetch(*args, **kwargs):
-        idx = pd.DatetimeIndex(
-            [
-                "2025-11-27 00:00:00+09:00",
-                "2025-11-27 00:15:00+09:00",
-            ]
-        )
-        return pd.DataFrame(
-            {"Open": [1.0, 1.1], "High": [1.2, 1.2], "Low": [0.9, 1.0], "Close": [1.05, 1.1], "Volume": [10, 12]},
-            index=idx,
-        )
-
-    monkeypatch.setattr(archive_ohlc_for_day.data_fetcher, "fetch_ohlc_range_dataframe", _fake_fetch)
+    monkeypatch.setattr(archive_ohlc_for_day.data_fetcher, "fetch_ohlc_range_multi", _fake_fetch)
 
     exit_code = archive_ohlc_for_day.main(
         [
@@ -46,6 +48,8 @@ def test_archive_ohlc_for_day_creates_csv(monkeypatch, tmp_path):
             market_date.strftime("%Y-%m-%d"),
             "--pairs",
             "USDJPY",
+            "--format",
+            "csv",
         ]
     )
 
@@ -57,3 +61,27 @@ def test_archive_ohlc_for_day_creates_csv(monkeypatch, tmp_path):
     lines = content.splitlines()
     assert len(lines) > 0, "CSV file should not be empty"
     assert "datetime" in lines[0]
+
+
+def test_archive_ohlc_for_day_defaults_to_parquet(monkeypatch, tmp_path):
+    pytest.importorskip("pyarrow")
+    target_date = date(2025, 11, 27)
+    market_date = date(2025, 11, 28)
+
+    monkeypatch.setattr(data_manager, "get_data_root", lambda: tmp_path / "data")
+    monkeypatch.setattr(archive_ohlc_for_day.data_fetcher, "fetch_ohlc_range_multi", _fake_fetch)
+
+    exit_code = archive_ohlc_for_day.main(
+        ["--market-date", market_date.strftime("%Y-%m-%d"), "--pairs", "USDJPY"]
+    )
+
+    assert exit_code == 0
+    parquet_path = data_manager.get_daily_ohlc_filepath(target_date, "USDJPY", "15m", "parquet")
+    assert parquet_path.exists()
+    df = pd.read_parquet(parquet_path)
+    assert list(df.columns) == ["open", "high", "low", "close", "volume"]
+    assert df.index.name == "datetime"
+    # tz-aware index survives the round trip, so readers need no date re-parsing
+    assert df.index.tz is not None
+    assert df.index[0] == pd.Timestamp("2025-11-27 00:00:00+09:00")
+    assert len(df) == 2
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = PROJECT_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from fx_kline.core import l3_evaluator  # noqa: E402
+
+
+def _write_summary(path: Path, close: float) -> None:
+    path.write_text(
+        json.dumps({"timeframes": {"1d": {"open": 150.0, "high": 151.0, "low": 149.0, "close": close, "atr": 0.8}}}),
+        encoding="utf-8",
+    )
+
+
+def test_load_actual_outcome_reparses_only_when_file_changes(tmp_path):
+    l3_evaluator._load_ohlc_raw.cache_clear()
+    summary = tmp_path / "ohlc_summary.json"
+    _write_summary(summary, 150.5)
+
+    first = l3_evaluator.load_actual_outcome(summary, "USDJPY")
+    l3_evaluator.load_actual_outcome(summary, "USDJPY")
+    assert l3_evaluator._load_ohlc_raw.cache_info().misses == 1
+    assert first.close_price == 150.5
+
+    _write_summary(summary, 149.5)
+    stat = summary.stat()
+    os.utime(summary, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = l3_evaluator.load_actual_outcome(summary, "USDJPY")
+    assert second.close_price == 149.5
+    assert second.period_return < 0
+    l3_evaluator._load_ohlc_raw.cache_clear()
+
+
+def _evaluation(correct: bool, confidence, regime, intervention=None, success=None):
+    prediction = l3_evaluator.PredictionInput(direction="LONG", pair="USDJPY", confidence_score=confidence)
+    actual = l3_evaluator.ActualOutcome("USDJPY", 150.0, 151.0, 149.0, 150.5, 0.0033, 0.8)
+    return l3_evaluator.EvaluationResult(
+        date="2025-11-28",
+        pair="USDJPY",
+        mode="hitl",
+        prediction=prediction,
+        actual=actual,
+        metrics=l3_evaluator.TradeMetrics(direction_correct=correct),
+        market_regime=regime,
+        intervention_type=intervention,
+        intervention_success=success,
+    )
+
+
+def test_aggregate_evaluations_groups_by_regime_and_intervention():
+    evaluations = [
+        _evaluation(True, 0.8, "TRENDING", "risk_reduction", True),
+        _evaluation(False, None, "TRENDING", "risk_reduction", False),
+        _evaluation(True, 0.4, "RANGING", "trade_cancellation", True),
+        _evaluation(True, 0.6, None),
+    ]
+
+    agg = l3_evaluator.aggregate_evaluations(evaluations, mode="hitl")
+
+    assert agg.total_trades == 4
+    assert agg.direction_accuracy == 0.75
+    assert abs(agg.avg_confidence - 0.6) < 1e-12
+    assert agg.avg_confidence_calibration == 0.0
+    assert agg.accuracy_by_regime == {"RANGING": 1.0, "TRENDING": 0.5}
+    assert agg.total_interventions == 3
+    assert agg.intervention_impact == {
+        "risk_reduction": {"count": 2, "success_rate": 0.5},
+        "trade_cancellation": {"count": 1, "success_rate": 1.0},
+    }
+
+
+def test_evaluate_batch_matches_single_trade_metrics():
+    actual = l3_evaluator.ActualOutcome("USDJPY", 150.0, 151.0, 149.0, 150.5, 0.5 / 150.0, 0.8)
+    flat = l3_evaluator.ActualOutcome("USDJPY", 150.0, 150.0, 150.0, 150.0, 0.0, 0.0)
+    predictions = [
+        l3_evaluator.PredictionInput("LONG", "USDJPY", 149.5, 149.2, 150.8, 0.7),
+        l3_evaluator.PredictionInput("SHORT", "USDJPY", 150.6, 151.2, 149.4, 0.6),
+        l3_evaluator.PredictionInput("LONG", "USDJPY", 150.2, 148.5, None, None),
+        l3_evaluator.PredictionInput("WAIT", "USDJPY", None, None, None, 0.5),
+        l3_evaluator.PredictionInput("SHORT", "USDJPY", 150.0, None, None, None),
+    ]
+    actuals = [actual, actual, actual, actual, flat]
+
+    batch = l3_evaluator.evaluate_batch(predictions, actuals)
+
+    for metrics, prediction, actual in zip(batch, predictions, actuals):
+        assert metrics.direction_correct == l3_evaluator.evaluate_direction_accuracy(prediction, actual)
+        assert metrics.entry_timing_score == l3_evaluator.calculate_entry_timing_score(prediction, actual)
+        assert metrics.pips_outcome == l3_evaluator.calculate_pips_outcome(prediction, actual)
+    assert batch[1].pips_outcome == 120.0
+    assert batch[4].entry_timing_score == 0.0
+
+
+def test_evaluate_batch_flat_short_scores_positive_zero():
+    actual = l3_evaluator.ActualOutcome("USDJPY", 150.0, 150.5, 149.5, 150.0, 0.0, 0.8)
+    prediction = l3_evaluator.PredictionInput("SHORT", "USDJPY", 150.0, 151.0, 149.0, None)
+
+    (metrics,) = l3_evaluator.evaluate_batch([prediction], [actual])
+
+    # A flat SHORT must not come out as -0.0
+    assert math.copysign(1.0, metrics.pips_outcome) == 1.0
+    assert math.copysign(1.0, metrics.risk_reward_realized) == 1.0
+
+
+def test_calculate_pips_outcome_flat_short_is_positive_zero():
+    actual = l3_evaluator.ActualOutcome("USDJPY", 150.0, 150.5, 149.5, 150.0, 0.0, 0.8)
+    prediction = l3_evaluator.PredictionInput("SHORT", "USDJPY", 150.0, 151.0, 149.0, None)
+
+    pips = l3_evaluator.calculate_pips_outcome(prediction, actual)
+
+    assert math.copysign(1.0, pips) == 1.0
+
+
+def test_pips_use_per_pair_pip_value():
+    actual = l3_evaluator.ActualOutcome("EURUSD", 1.1500, 1.1560, 1.1480, 1.1540, 0.0035, 0.006)
+    prediction = l3_evaluator.PredictionInput("LONG", "EURUSD", 1.1500, 1.1450, 1.1550, None)
+
+    assert l3_evaluator.calculate_pips_outcome(prediction, actual) == 50.0
+    result = l3_evaluator.evaluate_single_trade(prediction, actual)
+    assert result.metrics.pips_outcome == 50.0
+    assert abs(result.metrics.risk_reward_realized - 1.0) < 1e-9
+
+
+def test_load_actual_outcomes_builds_one_outcome_per_pair(tmp_path):
+    usdjpy = tmp_path / "USDJPY_summary.json"
+    eurusd = tmp_path / "EURUSD_summary.json"
+    _write_summary(usdjpy, 151.5)
+    eurusd.write_text(
+        json.dumps({"timeframes": {"1d": {"open": 0.0, "high": 1.16, "low": 1.15, "close": 1.155}}}),
+        encoding="utf-8",
+    )
+
+    outcomes = l3_evaluator.load_actual_outcomes({"USDJPY": usdjpy, "EURUSD": eurusd})
+
+    assert list(outcomes) == ["USDJPY", "EURUSD"]
+    assert outcomes["USDJPY"].period_return == (151.5 - 150.0) / 150.0
+    assert outcomes["EURUSD"].period_return == 0.0
+    assert outcomes["EURUSD"].volatility == 0.0
+
+
+def test_run_batch_evaluates_each_day_against_next_summary(tmp_path):
+    l3_evaluator._load_ohlc_raw.cache_clear()
+    for day, direction in (("2025-11-27", "LONG"), ("2025-11-28", "SHORT")):
+        (tmp_path / day).mkdir()
+        (tmp_path / day / "L3_prediction.json").write_text(
+            json.dumps({"prediction": {"direction": direction, "pair": "USDJPY", "entry_price": 150.2}}),
+            encoding="utf-8",
+        )
+    (tmp_path / "2025-12-01").mkdir()
+    _write_summary(tmp_path / "2025-11-28" / "ohlc_summary.json", 150.5)
+    _write_summary(tmp_path / "2025-12-01" / "ohlc_summary.json", 149.5)
+
+    tasks = l3_evaluator.find_batch_tasks(tmp_path, "ai")
+    assert [(t[0].parent.name, t[1].parent.name) for t in tasks] == [
+        ("2025-11-27", "2025-11-28"),
+        ("2025-11-28", "2025-12-01"),
+    ]
+
+    aggregate_path = tmp_path / "aggregate.json"
+    aggregated = l3_evaluator.run_batch(tmp_path, "ai", aggregate_path, max_workers=2)
+
+    assert aggregated.total_trades == 2
+    assert aggregated.direction_accuracy == 1.0
+    assert (tmp_path / "2025-11-27" / "L4_ai_evaluation.json").is_file()
+    assert json.loads(aggregate_path.read_text(encoding="utf-8"))["total_trades"] == 2
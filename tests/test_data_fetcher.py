@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = PROJECT_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from fx_kline.core import data_fetcher  # noqa: E402
+
+
+def _fake_multi_download(tickers, **kwargs):
+    assert kwargs["group_by"] == "ticker"
+    idx = pd.DatetimeIndex(
+        ["2025-11-26 15:00:00+00:00", "2025-11-26 15:15:00+00:00"],
+    )
+    fields = ["Open", "High", "Low", "Close", "Volume"]
+    frames = {
+        "USDJPY=X": pd.DataFrame(
+            [[155.0, 155.2, 154.9, 155.1, 0], [155.1, 155.3, 155.0, 155.2, 0]],
+            index=idx,
+            columns=fields,
+        ),
+        # Second bar missing for this ticker (union index padding)
+        "EURUSD=X": pd.DataFrame(
+            [[1.15, 1.16, 1.14, 1.155, 0], [None] * 5],
+            index=idx,
+            columns=fields,
+        ),
+    }
+    return pd.concat({t: frames[t] for t in tickers}, axis=1)
+
+
+def test_fetch_ohlc_range_multi_splits_per_pair(monkeypatch):
+    monkeypatch.setattr(data_fetcher.yf, "download", _fake_multi_download)
+
+    frames = data_fetcher.fetch_ohlc_range_multi(
+        pairs=["USDJPY", "EURUSD"],
+        interval="15m",
+        start=datetime(2025, 11, 27),
+        end=datetime(2025, 11, 28),
+        exclude_weekends=True,
+    )
+
+    assert set(frames) == {"USDJPY", "EURUSD"}
+    assert list(frames["USDJPY"].columns) == ["Open", "High", "Low", "Close", "Volume"]
+    assert len(frames["USDJPY"]) == 2
+    assert len(frames["EURUSD"]) == 1
+    assert str(frames["USDJPY"].index.tz) == "Asia/Tokyo"
+    assert frames["USDJPY"].index[0].hour == 0
+
+
+def _ohlc_frame(start: str, periods: int) -> pd.DataFrame:
+    idx = pd.date_range(start, periods=periods, freq="15min", tz="UTC")
+    return pd.DataFrame(
+        {"Open": 1.0, "High": 1.2, "Low": 0.9, "Close": 1.1, "Volume": 0},
+        index=idx,
+    )
+
+
+def test_fetch_batch_ohlc_groups_requests_into_one_download(monkeypatch, tmp_path):
+    monkeypatch.setattr(data_fetcher, "_CACHE_DIR", tmp_path / "cache")
+    batch_calls = []
+    single_calls = []
+
+    def _fake_batch(symbols, interval, period):
+        batch_calls.append((tuple(symbols), interval, period))
+        # GBPJPY=X is missing from the batched result
+        frames = {s: _ohlc_frame("2025-11-26 01:00", 4) for s in symbols if s != "GBPJPY=X"}
+        return pd.concat(frames, axis=1)
+
+    def _fake_single(pair, interval, period):
+        single_calls.append(pair)
+        return _ohlc_frame("2025-11-26 01:00", 2)
+
+    monkeypatch.setattr(data_fetcher, "_download_batch", _fake_batch)
+    monkeypatch.setattr(data_fetcher, "_download_with_period", _fake_single)
+
+    requests = [
+        data_fetcher.OHLCRequest(pair="USDJPY", interval="15m", period="1d"),
+        data_fetcher.OHLCRequest(pair="EURUSD", interval="15m", period="1d"),
+        data_fetcher.OHLCRequest(pair="GBPJPY", interval="15m", period="1d"),
+    ]
+    response = data_fetcher.fetch_batch_ohlc_sync(requests)
+
+    assert batch_calls == [(("USDJPY=X", "EURUSD=X", "GBPJPY=X"), "15m", "1d")]
+    assert single_calls == ["GBPJPY=X"]
+    assert [d.pair for d in response.successful] == ["USDJPY", "EURUSD", "GBPJPY"]
+    assert [d.data_count for d in response.successful] == [4, 4, 2]
+
+
+def test_fetch_batch_ohlc_fetches_duplicate_requests_once(monkeypatch, tmp_path):
+    monkeypatch.setattr(data_fetcher, "_CACHE_DIR", tmp_path / "cache")
+    batch_calls = []
+
+    def _fake_batch(symbols, interval, period):
+        batch_calls.append(tuple(symbols))
+        return pd.concat({s: _ohlc_frame("2025-11-26 01:00", 4) for s in symbols}, axis=1)
+
+    monkeypatch.setattr(data_fetcher, "_download_batch", _fake_batch)
+
+    requests = [
+        data_fetcher.OHLCRequest(pair="USDJPY", interval="15m", period="1d"),
+        data_fetcher.OHLCRequest(pair="EURUSD", interval="15m", period="1d"),
+        data_fetcher.OHLCRequest(pair="USDJPY", interval="15m", period="1d"),
+    ]
+    response = data_fetcher.fetch_batch_ohlc_sync(requests)
+
+    assert batch_calls == [("USDJPY=X", "EURUSD=X")]
+    assert [d.pair for d in response.successful] == ["USDJPY", "EURUSD", "USDJPY"]
+    assert response.total_requested == 3
+
+
+def test_download_with_period_cached_reuses_fresh_entry(monkeypatch, tmp_path):
+    monkeypatch.setattr(data_fetcher, "_CACHE_DIR", tmp_path / "cache")
+    calls = []
+
+    def _fake_single(pair, interval, period):
+        calls.append(pair)
+        return _ohlc_frame("2025-11-26 01:00", 3)
+
+    monkeypatch.setattr(data_fetcher, "_download_with_period", _fake_single)
+
+    first = data_fetcher._download_with_period_cached("USDJPY=X", "15m", "1d")
+    second = data_fetcher._download_with_period_cached("USDJPY=X", "15m", "1d")
+    data_fetcher._download_with_period_cached("USDJPY=X", "15m", "1d", force_refresh=True)
+
+    assert calls == ["USDJPY=X", "USDJPY=X"]
+    # Parquet does not store DatetimeIndex.freq (yfinance frames never carry one)
+    pd.testing.assert_frame_equal(first, second, check_freq=False)
+
+
+def test_download_cache_dir_is_private(monkeypatch, tmp_path):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(data_fetcher, "_CACHE_DIR", cache_dir)
+    monkeypatch.setattr(data_fetcher, "_download_with_period", lambda *args: _ohlc_frame("2025-11-26 01:00", 3))
+
+    data_fetcher._download_with_period_cached("USDJPY=X", "15m", "1d")
+
+    assert cache_dir.stat().st_mode & 0o777 == 0o700
+    assert [p.suffix for p in cache_dir.iterdir()] == [".parquet"]
+
+
+def test_download_with_period_cached_prunes_expired_entries(monkeypatch, tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir(mode=0o700)
+    stale_entry = cache_dir / "stale.parquet"
+    stale_tmp = cache_dir / "stale.123.tmp"
+    recent_entry = cache_dir / "recent.parquet"
+    for path in (stale_entry, stale_tmp, recent_entry):
+        path.write_bytes(b"")
+    old = time.time() - data_fetcher._DAILY_CACHE_TTL_SECONDS - 60
+    os.utime(stale_entry, (old, old))
+    os.utime(stale_tmp, (old, old))
+    monkeypatch.setattr(data_fetcher, "_CACHE_DIR", cache_dir)
+    monkeypatch.setattr(data_fetcher, "_download_with_period", lambda *args: _ohlc_frame("2025-11-26 01:00", 3))
+
+    data_fetcher._download_with_period_cached("USDJPY=X", "15m", "1d")
+
+    assert not stale_entry.exists()
+    assert not stale_tmp.exists()
+    assert recent_entry.exists()
+    assert len(list(cache_dir.glob("*.parquet"))) == 2
+
+
+def test_download_with_period_cached_removes_temp_file_on_write_error(monkeypatch, tmp_path):
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(data_fetcher, "_CACHE_DIR", cache_dir)
+    monkeypatch.setattr(data_fetcher, "_download_with_period", lambda *args: _ohlc_frame("2025-11-26 01:00", 3))
+
+    def _failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(data_fetcher.os, "replace", _failing_replace)
+
+    df = data_fetcher._download_with_period_cached("USDJPY=X", "15m", "1d")
+
+    assert len(df) == 3
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_download_with_period_cached_skips_foreign_entries(monkeypatch, tmp_path):
+    monkeypatch.setattr(data_fetcher, "_CACHE_DIR", tmp_path / "cache")
+    calls = []
+
+    def _fake_single(pair, interval, period):
+        calls.append(pair)
+        return _ohlc_frame("2025-11-26 01:00", 3)
+
+    monkeypatch.setattr(data_fetcher, "_download_with_period", _fake_single)
+    data_fetcher._download_with_period_cached("USDJPY=X", "15m", "1d")
+
+    # Entries (and the directory) owned by another user are never loaded
+    real_uid = os.getuid()
+    monkeypatch.setattr(data_fetcher.os, "getuid", lambda: real_uid + 1)
+    data_fetcher._download_with_period_cached("USDJPY=X", "15m", "1d")
+
+    assert calls == ["USDJPY=X", "USDJPY=X"]
+
+
+def test_default_cache_dir_is_per_user(monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert data_fetcher._default_cache_dir() == tmp_path / "fx_kline"
+
+    monkeypatch.setenv("XDG_CACHE_HOME", "relative/path")
+    assert data_fetcher._default_cache_dir() == Path.home() / ".cache" / "fx_kline"
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = PROJECT_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from fx_kline.core.fast_csv import write_ohlc_csv  # noqa: E402
+
+
+def test_write_ohlc_csv_matches_pandas(tmp_path):
+    idx = pd.date_range("2025-11-27", periods=3, freq="15min", tz="Asia/Tokyo", name="datetime")
+    df = pd.DataFrame(
+        {
+            "open": [155.1, 155.12345, float("nan")],
+            "high": [155.3, 1e-05, 155.4],
+            "low": [154.9, 155.0, 155.05],
+            "close": [155.2, 155.1, 155.3],
+            "volume": [0, 12, 3],
+        },
+        index=idx,
+    )
+
+    fast_path = tmp_path / "fast.csv"
+    pandas_path = tmp_path / "pandas.csv"
+    write_ohlc_csv(df, fast_path)
+    df.to_csv(pandas_path, index=True)
+
+    assert fast_path.read_bytes() == pandas_path.read_bytes()
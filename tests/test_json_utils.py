@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import json
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+SRC_PATH = PROJECT_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from fx_kline.core import json_utils  # noqa: E402
+
+
+def test_dump_and_load_json_file_roundtrip(tmp_path):
+    payload = {"pair": "USDJPY", "date": date(2025, 11, 27), "scores": [1.5, 2], "note": "上昇"}
+    out_path = tmp_path / "out.json"
+
+    json_utils.dump_json_file(payload, out_path, indent=2, default=str)
+
+    loaded = json_utils.load_json_file(out_path)
+    assert loaded == {"pair": "USDJPY", "date": "2025-11-27", "scores": [1.5, 2], "note": "上昇"}
+    # Output stays interchangeable with the standard library
+    assert json.loads(out_path.read_text(encoding="utf-8")) == loaded
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_matches_stdlib_for_non_ascii_and_nan(monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_utils, "orjson", None)
+
+    payload = {"note": "上昇", "atr": float("nan"), "cap": float("inf"), "rsi": 55.5}
+
+    assert json_utils.dumps(payload, indent=2, ensure_ascii=True) == json.dumps(
+        payload, indent=2, ensure_ascii=True
+    )
+    assert json_utils.dumps(payload, indent=2) == json.dumps(payload, indent=2, ensure_ascii=False)
+
+
+def test_orjson_non_ascii_output_is_escaped_when_requested():
+    pytest.importorskip("orjson")
+
+    text = json_utils.dumps({"note": "上昇"}, indent=2, ensure_ascii=True)
+
+    assert text.isascii()
+    assert json.loads(text) == {"note": "上昇"}
+
+
+def test_load_json_file_accepts_stdlib_nan_tokens(tmp_path):
+    out_path = tmp_path / "legacy.json"
+    out_path.write_text(json.dumps({"atr": float("nan"), "cap": float("-inf")}), encoding="utf-8")
+
+    loaded = json_utils.load_json_file(out_path)
+
+    assert loaded["atr"] != loaded["atr"]
+    assert loaded["cap"] == float("-inf")
+
+
+def test_orjson_output_is_value_equal_for_small_floats():
+    pytest.importorskip("orjson")
+
+    payload = {"spread": 1e-05, "tiny": [2.5e-07, -3e-05]}
+
+    assert json.loads(json_utils.dumps(payload, indent=2)) == json.loads(json.dumps(payload, indent=2))
+
+
+def test_dumps_with_default_hands_types_to_it_like_stdlib():
+    pytest.importorskip("orjson")
+    np = pytest.importorskip("numpy")
+    from datetime import datetime
+
+    payload = {
+        "count": np.int64(3),
+        "flag": np.bool_(True),
+        "ratio": np.float64(1.5),
+        "at": datetime(2025, 1, 1, 9, 0),
+        "day": date(2025, 1, 1),
+    }
+
+    text = json_utils.dumps(payload, indent=2, default=str, ensure_ascii=True)
+
+    assert text == json.dumps(payload, indent=2, default=str, ensure_ascii=True)
+    assert json.loads(text)["at"] == "2025-01-01 09:00:00"
+    assert json.loads(text)["count"] == "3"
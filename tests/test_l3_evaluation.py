@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import json
+import math
 import sys
 from datetime import date, timedelta
 from pathlib import Path
 
 import pandas as pd
+import pytest
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 SRC_PATH = PROJECT_ROOT / "src"
@@ -110,6 +112,69 @@ def test_evaluator_runs_with_minimal_inputs():
     assert "strategies" in results
 
 
+def test_daily_stats_keep_missing_open_and_close():
+    pred_date = date(2025, 11, 28)
+    l3_json = {
+        "meta": {"version": "1.0", "generated_at": f"{pred_date} 09:00:00 JST"},
+        "market_environment": {},
+        "ranking": {"top_3": [], "bottom_3": []},
+        "strategies": [],
+    }
+    idx = pd.date_range(f"{pred_date} 09:00", periods=3, freq="15min", tz="Asia/Tokyo")
+    nan = float("nan")
+    df = pd.DataFrame(
+        {
+            "open": [nan, 100.5, 100.6],
+            "high": [100.4, 100.8, 100.9],
+            "low": [99.8, 100.2, 100.1],
+            "close": [100.3, 100.7, nan],
+        },
+        index=idx,
+    )
+    stats = L3Evaluator(l3_json, {"USDJPY": df}, {})._get_daily_stats("USDJPY")
+
+    # The day's open/close come from its first/last bar, gaps included
+    assert pd.isna(stats["open"])
+    assert pd.isna(stats["close"])
+    assert stats["high"] == 100.9
+    assert stats["low"] == 99.8
+
+
+def test_short_hold_at_entry_price_reports_positive_zero_pnl():
+    pred_date = date(2025, 11, 28)
+    l3_json = {
+        "meta": {"version": "1.0", "generated_at": f"{pred_date} 09:00:00 JST"},
+        "market_environment": {},
+        "ranking": {"top_3": [], "bottom_3": []},
+        "strategies": [
+            {
+                "pair": "USDJPY",
+                "strategy_type": "RALLY_SELL",
+                "valid_sessions": ["TOKYO"],
+                "entry": {"zone_min": 149.9, "zone_max": 150.1, "strict_limit": 150.0},
+                "exit": {"take_profit": 149.0, "stop_loss": 151.0},
+            }
+        ],
+    }
+    idx = pd.date_range(f"{pred_date} 09:00", periods=2, freq="15min", tz="Asia/Tokyo")
+    df = pd.DataFrame(
+        {
+            "open": [150.0, 150.0],
+            "high": [150.2, 150.3],
+            "low": [149.8, 149.7],
+            "close": [150.0, 150.0],
+        },
+        index=idx,
+    )
+    evaluator = L3Evaluator(l3_json, {"USDJPY": df}, {})
+    evaluator.simulate_trades()
+
+    (record,) = evaluator.results["strategies"]["per_pair"]["USDJPY"]
+    assert record["result"] == "HOLD"
+    # A flat SHORT must not be written as -0.0
+    assert math.copysign(1.0, record["pnl_pips"]) == 1.0
+
+
 def _make_evaluator_with_schema(schema_version: str | None) -> L3Evaluator:
     pred_date = date(2025, 11, 28)
     meta: dict[str, object] = {
@@ -173,3 +238,32 @@ def test_resolve_direction_old_schema_inferred_from_type():
     )
     assert direction == "LONG"
     assert status == "INFERRED_FROM_TYPE"
+
+
+@pytest.mark.parametrize("engine", ["pyarrow", "c"])
+def test_read_ohlc_file_builds_jst_index(monkeypatch, tmp_path, engine):
+    if engine == "pyarrow":
+        pytest.importorskip("pyarrow")
+    monkeypatch.setattr(run_l3_evaluation, "_CSV_ENGINE", engine)
+
+    idx = pd.date_range("2025-11-28 09:00", periods=3, freq="15min", tz="Asia/Tokyo", name="datetime")
+    archived = pd.DataFrame(
+        {
+            "open": [100.0, 100.6, 101.0],
+            "high": [100.8, 101.2, 101.5],
+            "low": [99.8, 100.4, 100.9],
+            "close": [100.7, 101.0, 101.4],
+            "volume": [1000, 900, 800],
+        },
+        index=idx,
+    )
+    csv_path = tmp_path / "USDJPY_15m.csv"
+    archived.to_csv(csv_path, index=True)
+
+    df = run_l3_evaluation._read_ohlc_file(csv_path)
+
+    assert list(df.columns) == ["open", "high", "low", "close", "volume"]
+    assert str(df.index.tz) == "Asia/Tokyo"
+    assert list(df.index) == list(idx)
+    assert (df[["open", "high", "low", "close"]].dtypes == "float64").all()
+    assert df["close"].tolist() == [100.7, 101.0, 101.4]